@@ -0,0 +1 @@
+"""Benchmarks for the Homeduino integration."""
@@ -0,0 +1,283 @@
+"""Replay RF packets through the receive path of the Homeduino coordinator."""
+
+import asyncio
+import json
+import os
+import random
+import time
+import tracemalloc
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from unittest.mock import patch
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+from homeassistant.setup import async_setup_component
+from homeduino import DEFAULT_BAUD_RATE
+from homeduino.homeduino import HomeduinoProtocol
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.homeduino import HomeduinoCoordinator, receive
+from custom_components.homeduino.const import (
+    CONF_ENTRY_TYPE,
+    CONF_ENTRY_TYPE_RF_DEVICE,
+    CONF_RF_ID,
+    CONF_RF_PROTOCOL,
+    CONF_RF_UNIT,
+    DOMAIN,
+)
+from custom_components.homeduino.protocols import protocol_family
+from custom_components.homeduino.transceiver import ConnectionTrackingHomeduino
+from tests.common import FakeClock
+
+# (time, protocol, values) of a received RF packet, like the captures of a
+# transceiver
+Packet = tuple[float, str, dict]
+
+# Share of the synthetic transmissions per protocol
+DEFAULT_MIX = {"switch1": 0.5, "pir1": 0.2, "weather4": 0.3}
+
+REPLAY_DEVICE_ID = "replay"
+
+# Monotonic time of the last replayed packet, a next replay continues after it
+_replay_end = 0.0
+
+
+@dataclass
+class ReplayResult:
+    """Time spent in the receive callback per replayed packet."""
+
+    latencies: list[float]
+    state_writes: int
+    peak_memory: int | None
+
+    def percentile(self, p: int) -> float:
+        """Return the latency percentile in milliseconds."""
+        latencies = sorted(self.latencies)
+        return latencies[(len(latencies) - 1) * p // 100] * 1000
+
+    @property
+    def packets_per_second(self) -> float:
+        """Return the number of packets the receive callback handles per second."""
+        return len(self.latencies) / sum(self.latencies)
+
+    def __str__(self) -> str:
+        result = (
+            f"{len(self.latencies)} packets, "
+            f"{self.packets_per_second:.0f} packets/s, "
+            f"p50 {self.percentile(50):.3f} ms, "
+            f"p95 {self.percentile(95):.3f} ms, "
+            f"p99 {self.percentile(99):.3f} ms, "
+            f"max {self.percentile(100):.3f} ms, "
+            f"{self.state_writes / len(self.latencies):.2f} state writes/packet"
+        )
+        if self.peak_memory is not None:
+            result += f", peak {self.peak_memory / 1024:.0f} KiB"
+
+        return result
+
+
+class ReplayHomeduino(ConnectionTrackingHomeduino):
+    """Homeduino without hardware, connected to a transport which sends nothing.
+
+    The replayed packets are fed to the receive callback of the coordinator.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(os.devnull, DEFAULT_BAUD_RATE, None, None)
+
+    async def connect(self, *_args, **_kwargs) -> bool:
+        self.protocol = HomeduinoProtocol()
+        self.protocol.connection_made(asyncio.Transport())
+        self._connection_changed(True)
+        return True
+
+    async def disconnect(self) -> bool:
+        self.protocol = None
+        return True
+
+    async def ping(self) -> bool:
+        return True
+
+
+def _synthetic_values(protocol: str, id_: int, rng: random.Random) -> dict:
+    family = protocol_family(protocol)
+    if family in ("switch", "dimmer"):
+        return {"id": id_, "unit": 0, "all": False, "state": rng.random() < 0.5}
+    if family == "contact":
+        return {"id": id_, "unit": 0, "state": rng.random() < 0.5}
+    if family == "pir":
+        return {"id": id_, "unit": 0, "state": True}
+    if family == "weather":
+        return {
+            "id": id_,
+            "unit": 0,
+            "temperature": round(rng.uniform(-10, 30), 1),
+            "humidity": rng.randrange(20, 90),
+            "lowBattery": rng.random() < 0.01,
+        }
+
+    raise ValueError(f"No synthetic packets for protocol {protocol}")
+
+
+def synthetic_packets(
+    count: int,
+    devices: int = 10,
+    mix: dict[str, float] | None = None,
+    rate: float = 20.0,
+    repeats: int = 1,
+    seed: int = 0,
+) -> list[Packet]:
+    """Return packets of random devices of a mix of protocols.
+
+    The packets arrive at the rate in packets per second on average, repeats
+    included, and the transmissions are shared between the protocols of the mix
+    by weight. Every transmission is received the given number of times, like
+    the repeats of a RF command.
+    """
+    mix = mix or DEFAULT_MIX
+    protocols = list(mix)
+    weights = list(mix.values())
+    rng = random.Random(seed)
+    packets: list[Packet] = []
+    timestamp = 0.0
+    while len(packets) < count:
+        timestamp += rng.expovariate(rate / repeats)
+        protocol = rng.choices(protocols, weights)[0]
+        values = _synthetic_values(protocol, rng.randrange(devices), rng)
+        for repeat in range(repeats):
+            packets.append((timestamp + repeat * 0.05, protocol, values))
+
+    packets.sort(key=lambda packet: packet[0])
+    return packets[:count]
+
+
+def load_capture(path: str | os.PathLike) -> list[Packet]:
+    """Load recorded packets from a diagnostics download or a list of captures.
+
+    The captures of all transceivers in a diagnostics download are merged.
+    """
+    data = json.loads(Path(path).read_text())
+    return sorted(
+        (
+            (capture["time"], capture["protocol"], capture["values"])
+            for capture in _captures(data)
+        ),
+        key=lambda packet: packet[0],
+    )
+
+
+def _captures(data) -> Iterator[dict]:
+    if isinstance(data, list):
+        for item in data:
+            if isinstance(item, dict) and "protocol" in item and "values" in item:
+                yield item
+            else:
+                yield from _captures(item)
+    elif isinstance(data, dict):
+        for value in data.values():
+            yield from _captures(value)
+
+
+async def async_setup_rf_devices(
+    hass: HomeAssistant, devices: Iterable[tuple[str, int, int | None]]
+) -> list[ConfigEntry]:
+    """Set up a RF device entry with its entities per (protocol, id, unit)."""
+    entries = []
+    for protocol, id_, unit in devices:
+        identifier = f"{protocol}-{id_}"
+        title = f"{protocol} {id_}"
+        data = {
+            CONF_ENTRY_TYPE: CONF_ENTRY_TYPE_RF_DEVICE,
+            CONF_RF_PROTOCOL: protocol,
+            CONF_RF_ID: id_,
+        }
+        if unit is not None:
+            identifier += f"-{unit}"
+            title += f" {unit}"
+            data[CONF_RF_UNIT] = unit
+
+        entry = MockConfigEntry(
+            domain=DOMAIN, title=title, unique_id=f"{DOMAIN}-{identifier}", data=data
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+
+    if DOMAIN not in hass.config.components:
+        assert await async_setup_component(hass, DOMAIN, {})
+    else:
+        for entry in entries:
+            assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    return entries
+
+
+async def async_replay(
+    hass: HomeAssistant,
+    packets: Iterable[Packet],
+    options: dict | None = None,
+    realtime: bool = False,
+    trace_memory: bool = True,
+) -> ReplayResult:
+    """Feed packets to the receive callback of a transceiver without hardware.
+
+    The packets are replayed as fast as possible, with the clock of the receive
+    helpers following the packet timestamps so de-duplication and discovery see
+    the recorded intervals, or in real time if realtime is set. Tracing the
+    memory slows down every allocation, so the latencies are only comparable
+    between replays with the same trace_memory.
+    """
+    global _replay_end
+
+    coordinator = HomeduinoCoordinator.instance(hass)
+    coordinator.add_transceiver(REPLAY_DEVICE_ID, ReplayHomeduino(), options)
+    await coordinator.async_start_transceiver(REPLAY_DEVICE_ID)
+    await hass.async_block_till_done()
+
+    latencies: list[float] = []
+    state_writes = 0
+    write_ha_state = Entity.async_write_ha_state
+
+    def count_write_ha_state(entity: Entity) -> None:
+        nonlocal state_writes
+        state_writes += 1
+        write_ha_state(entity)
+
+    start = max(time.monotonic(), _replay_end + 1)
+    clock = FakeClock(start)
+    first = None
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        with (
+            patch.object(Entity, "async_write_ha_state", count_write_ha_state),
+            patch.object(receive, "time", time if realtime else clock),
+        ):
+            for timestamp, protocol, values in packets:
+                if first is None:
+                    first = timestamp
+                now = start + timestamp - first
+                if realtime:
+                    await asyncio.sleep(max(0.0, now - clock.now))
+                clock.now = now
+
+                decoded = {"protocol": protocol, "values": dict(values)}
+                begin = time.perf_counter()
+                coordinator.rf_receive_callback(REPLAY_DEVICE_ID, decoded)
+                latencies.append(time.perf_counter() - begin)
+
+                # Let the work scheduled by the packet run, like between serial
+                # reads
+                await asyncio.sleep(0)
+        peak_memory = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+        _replay_end = clock.now
+        await coordinator.remove_transceiver(REPLAY_DEVICE_ID)
+
+    await hass.async_block_till_done()
+    return ReplayResult(latencies, state_writes, peak_memory)
@@ -0,0 +1,50 @@
+"""Benchmark the RF packet dispatch with a growing number of entities."""
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.homeduino import HomeduinoCoordinator
+from custom_components.homeduino.const import CONF_RF_DEDUP_WINDOW
+
+from .replay import async_replay, async_setup_rf_devices, synthetic_packets
+
+ENTITIES = (10, 100, 1000, 5000)
+PACKETS = 5000
+
+# Allowed growth of the median time per packet from the fewest to the most entities
+MAX_SLOWDOWN = 3
+
+
+async def test_dispatch_entities(hass: HomeAssistant) -> None:
+    """Replay packets to one of the switches each, the cost should stay flat.
+
+    De-duplication is disabled, so every packet reaches the listener index no
+    matter how many devices share the packets.
+    """
+    coordinator = HomeduinoCoordinator.instance(hass)
+    medians: dict[int, float] = {}
+    configured = 0
+    for entities in ENTITIES:
+        await async_setup_rf_devices(
+            hass, (("switch1", id_, 0) for id_ in range(configured, entities))
+        )
+        configured = entities
+
+        packets = synthetic_packets(
+            PACKETS, devices=entities, mix={"switch1": 1}, seed=entities
+        )
+        suppressed_state_writes = coordinator.suppressed_state_writes
+        result = await async_replay(
+            hass, packets, {CONF_RF_DEDUP_WINDOW: 0}, trace_memory=False
+        )
+
+        print(f"\n{entities} entities: {result}")
+        # Every packet is handled by its switch, by a state write or suppressed
+        assert (
+            result.state_writes
+            + coordinator.suppressed_state_writes
+            - suppressed_state_writes
+            == len(packets)
+        )
+        medians[entities] = result.percentile(50)
+
+    assert medians[ENTITIES[-1]] <= medians[ENTITIES[0]] * MAX_SLOWDOWN
@@ -0,0 +1,67 @@
+"""Benchmark the RF receive path with replayed packets."""
+
+import os
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.homeduino.const import CONF_RF_NOISE_FILTER
+
+from .replay import (
+    DEFAULT_MIX,
+    async_replay,
+    async_setup_rf_devices,
+    load_capture,
+    synthetic_packets,
+)
+
+DEVICES = 100
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {CONF_RF_NOISE_FILTER: ["pir", "switch", "weather"]}],
+    ids=["all", "noise_filter"],
+)
+async def test_replay_synthetic(hass: HomeAssistant, options: dict) -> None:
+    """Replay a mix of packets of which half are addressed to configured devices."""
+    await async_setup_rf_devices(
+        hass,
+        (
+            (protocol, id_, 0)
+            for protocol in DEFAULT_MIX
+            for id_ in range(0, DEVICES, 2)
+        ),
+    )
+
+    packets = synthetic_packets(10000, devices=DEVICES, rate=50, repeats=3)
+    result = await async_replay(hass, packets, options)
+
+    print(f"\nsynthetic {'/'.join(options) or 'all'}: {result}")
+    assert len(result.latencies) == len(packets)
+    assert result.state_writes > 0
+
+
+async def test_replay_capture(hass: HomeAssistant) -> None:
+    """Replay the recorded packets of the capture in HOMEDUINO_CAPTURE.
+
+    The entities of the captured devices are set up first.
+    """
+    if (path := os.environ.get("HOMEDUINO_CAPTURE")) is None:
+        pytest.skip("HOMEDUINO_CAPTURE is not set")
+
+    packets = load_capture(path)
+    await async_setup_rf_devices(
+        hass,
+        {
+            (protocol, values["id"], values.get("unit"))
+            for _, protocol, values in packets
+            if values.get("id") is not None
+        },
+    )
+    result = await async_replay(
+        hass, packets, realtime=bool(os.environ.get("HOMEDUINO_REALTIME"))
+    )
+
+    print(f"\n{path}: {result}")
+    assert len(result.latencies) == len(packets)
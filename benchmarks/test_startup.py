@@ -0,0 +1,58 @@
+"""Benchmark the startup with a growing number of RF device entries."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.homeduino import async_setup_services
+from custom_components.homeduino.const import (
+    CONF_ENTRY_TYPE,
+    CONF_ENTRY_TYPE_RF_DEVICE,
+    CONF_RF_ID,
+    CONF_RF_PROTOCOL,
+    CONF_RF_UNIT,
+    DOMAIN,
+)
+
+
+@pytest.mark.parametrize("entries", [10, 100, 250, 1000])
+async def test_startup_entries(hass: HomeAssistant, entries: int) -> None:
+    """Set up RF device entries, the time per entry should not grow."""
+    for id_ in range(entries):
+        MockConfigEntry(
+            domain=DOMAIN,
+            title=f"switch1 {id_} 0",
+            unique_id=f"{DOMAIN}-switch1-{id_}-0",
+            data={
+                CONF_ENTRY_TYPE: CONF_ENTRY_TYPE_RF_DEVICE,
+                CONF_RF_PROTOCOL: "switch1",
+                CONF_RF_ID: id_,
+                CONF_RF_UNIT: 0,
+            },
+        ).add_to_hass(hass)
+
+    with patch(
+        "custom_components.homeduino.async_setup_services",
+        wraps=async_setup_services,
+    ) as mock_setup_services:
+        start = time.perf_counter()
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done()
+        elapsed = time.perf_counter() - start
+
+    print(
+        f"\n{entries} entries: {elapsed:.3f} s, "
+        f"{elapsed / entries * 1000:.3f} ms per entry"
+    )
+    assert mock_setup_services.call_count == 1
+    assert all(
+        entry.state is ConfigEntryState.LOADED
+        for entry in hass.config_entries.async_entries(DOMAIN)
+    )
+    for service in ("send", "rf_send", "rf_send_batch", "raw_rf_send"):
+        assert hass.services.has_service(DOMAIN, service)
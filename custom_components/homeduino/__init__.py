@@ -1,31 +1,31 @@
 """The Homeduino 433 MHz RF transceiver integration."""
 
-import json
+import asyncio
 import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from functools import partial
 
 import homeassistant.helpers.config_validation as cv
 import serial
-import voluptuous as vol
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import SOURCE_INTEGRATION_DISCOVERY, ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import discovery_flow
 from homeassistant.helpers.device_registry import DeviceEntry
-from homeassistant.helpers.selector import (
-    BooleanSelector,
-    NumberSelector,
-    NumberSelectorConfig,
-    NumberSelectorMode,
-    SelectSelector,
-    SelectSelectorConfig,
-    SelectSelectorMode,
-)
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeduino import (
     DEFAULT_BAUD_RATE,
     DEFAULT_REPEATS,
     Homeduino,
+    HomeduinoError,
+    HomeduinoPinMode,
     HomeduinoResponseTimeoutError,
 )
 
@@ -34,15 +34,63 @@ from .const import (
     CONF_ENTRY_TYPE,
     CONF_ENTRY_TYPE_RF_DEVICE,
     CONF_ENTRY_TYPE_TRANSCEIVER,
+    CONF_FAST_STARTUP,
     CONF_IO_ANALOG_,
+    CONF_IO_DHT11,
+    CONF_IO_DHT22,
     CONF_IO_DIGITAL_,
+    CONF_IO_DIGITAL_INPUT,
+    CONF_IO_DIGITAL_OUTPUT,
+    CONF_IO_PWM_OUTPUT,
     CONF_IO_RF_RECEIVE,
     CONF_IO_RF_SEND,
     CONF_RECEIVE_PIN,
+    CONF_RF_AVAILABILITY,
+    CONF_RF_AVAILABILITY_ALL,
+    CONF_RF_AVAILABILITY_ANY,
+    CONF_RF_AVAILABILITY_TRANSCEIVER,
+    CONF_RF_CAPTURE_SIZE,
+    CONF_RF_DEDUP_WINDOW,
+    CONF_RF_DUTY_CYCLE,
+    CONF_RF_EVENTS,
+    CONF_RF_EVENTS_ALL,
+    CONF_RF_EVENTS_LIST,
+    CONF_RF_EVENTS_UNCLAIMED,
+    CONF_RF_GROUP_COMMANDS,
+    CONF_RF_ID,
     CONF_RF_ID_IGNORE_ALL,
+    CONF_RF_NOISE_ALLOWLIST,
+    CONF_RF_NOISE_FILTER,
+    CONF_RF_PROTOCOL,
+    CONF_RF_TRANSCEIVER,
+    CONF_RF_UNIT,
     CONF_SEND_PIN,
     CONF_SERIAL_PORT,
+    DEFAULT_RF_DEDUP_WINDOW,
+    DEFAULT_RF_DUTY_CYCLE,
     DOMAIN,
+    RF_DEDUP_WINDOWS,
+)
+from .network import create_homeduino
+from .protocols import protocol_catalogue, protocol_family
+from .receive import (
+    RFCandidateTable,
+    RFDeduplicator,
+    RFReceiveLog,
+    RFReceiveStats,
+    RFReceptionHistory,
+)
+from .services import async_setup_services
+from .transceiver import ConnectionTrackingHomeduino
+from .transmit import (
+    PRIORITY_AUTOMATION,
+    PRIORITY_BULK,
+    RFAdaptiveRepeats,
+    RFRoutingTable,
+    RFTransmitQueue,
+    plan_rf_batch,
+    raw_rf_airtime,
+    rf_airtime,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -55,33 +103,57 @@ PLATFORMS: list[Platform] = [
     Platform.SWITCH,
 ]
 
-CONF_SERVICE_DEVICE_ID = "device_id"
-CONF_SERVICE_COMMAND = "command"
-CONF_SERVICE_PROTOCOL = "protocol"
-CONF_SERVICE_ID = "id"
-CONF_SERVICE_UNIT = "unit"
-CONF_SERVICE_STATE = "state"
-CONF_SERVICE_ALL = "all"
-CONF_SERVICE_REPEATS = "repeats"
-
-SERVICE_SEND_SCHEMA = vol.Schema(
-    {
-        vol.Required(CONF_SERVICE_DEVICE_ID): cv.string,
-        vol.Required(CONF_SERVICE_COMMAND): cv.string,
-    }
-)
-SERVICE_RAW_RF_SEND_SCHEMA = vol.Schema(
-    {
-        vol.Required(CONF_SERVICE_COMMAND): cv.string,
-        vol.Optional(CONF_SERVICE_REPEATS, default=DEFAULT_REPEATS): NumberSelector(
-            NumberSelectorConfig(min=1, mode=NumberSelectorMode.BOX)
-        ),
-    }
-)
-
 ALLOWED_FAILED_PINGS = 1
+RF_SEND_TIMEOUT = 10
+STARTUP_MAX_IN_FLIGHT = 4
+SUPERVISOR_INTERVAL = 10
+RECONNECT_BACKOFF_MIN = 1
+RECONNECT_BACKOFF_MAX = 60
+
+STORAGE_VERSION = 1
+STORAGE_KEY = DOMAIN
+STORAGE_SAVE_DELAY = 10
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+def _rf_identifier(protocol: str, id_: int, unit: int | None = None) -> str:
+    """Return the identifier of a RF device."""
+    identifier = f"{protocol}-{id_}"
+    if unit is not None:
+        identifier += f"-{unit}"
+
+    return identifier
+
 
-_service_rf_send_schema: vol.Schema
+def _transceiver_pin_modes(options, inputs=False) -> dict[int, HomeduinoPinMode]:
+    """Return the pin modes of the digital outputs configured in the options.
+
+    Inputs are left out unless requested, subscribing to them sets their pin mode.
+    """
+    pin_modes = {}
+    for digital_io in range(2, 14):
+        value = options.get(CONF_IO_DIGITAL_ + str(digital_io))
+        if value in (CONF_IO_DIGITAL_OUTPUT, CONF_IO_PWM_OUTPUT):
+            pin_modes[digital_io] = HomeduinoPinMode.OUTPUT
+        elif inputs and value == CONF_IO_DIGITAL_INPUT:
+            pin_modes[digital_io] = HomeduinoPinMode.INPUT_PULLUP
+        elif inputs and value in (CONF_IO_DHT11, CONF_IO_DHT22):
+            pin_modes[digital_io] = HomeduinoPinMode.INPUT
+
+    return pin_modes
+
+
+def _reconnect_delay(attempt: int) -> float:
+    """Return the jittered exponential backoff before a connect attempt."""
+    delay = min(RECONNECT_BACKOFF_MAX, RECONNECT_BACKOFF_MIN * 2**attempt)
+    return random.uniform(delay / 2, delay)
+
+
+def _rf_key(identifier: str) -> tuple:
+    """Return the (protocol, id, unit) key of a RF device identifier."""
+    protocol, id_, *unit = identifier.split("-")
+    return (protocol, int(id_), int(unit[0]) if unit else None)
 
 
 class HomeduinoCoordinator(DataUpdateCoordinator):
@@ -104,81 +176,1021 @@ class HomeduinoCoordinator(DataUpdateCoordinator):
             name=__name__,
         )
         self._transceivers = {}
+        # Transceivers which are connected and started, updated as soon as their
+        # connection is lost and once the startup plan is replayed after reconnect
+        self._connected: set[str] = set()
+        # Availability policy and transceiver per RF device (protocol, id, unit)
+        self._rf_availability: dict[tuple, tuple[str, str | None]] = {}
+        # RF devices (protocol, id, unit) whose commands may be collapsed into an
+        # all/group command by the transmit queue
+        self._rf_group_commands: set[tuple] = set()
+        self._rf_dedup_windows: dict[str, float] = {}
+        # Protocol families to filter noise of and the allowed (protocol, id) per
+        # transceiver
+        self._rf_noise_families: dict[str, frozenset[str]] = {}
+        self._rf_noise_allowlists: dict[str, frozenset[tuple]] = {}
+        # Number of packets dropped as noise per protocol
+        self.rf_noise_dropped: dict[str, int] = {}
+        # Which packets fire a bus event and the listed (protocol, id) per
+        # transceiver
+        self._rf_events: dict[str, str] = {}
+        self._rf_events_lists: dict[str, frozenset[tuple]] = {}
+        # Number of bus events fired and skipped
+        self.rf_events_fired = 0
+        self.rf_events_skipped = 0
+        self._rf_transmit_queues: dict[str, RFTransmitQueue] = {}
+        self._rf_transmit_tasks: dict[str, asyncio.Task] = {}
+        # Startup plan per transceiver, the pin modes from the options and the
+        # jobs of the entities with whether to replay them after a reconnect
+        self._pin_modes: dict[str, dict[int, HomeduinoPinMode]] = {}
+        self._replay_pin_modes: dict[str, dict[int, HomeduinoPinMode]] = {}
+        self._startup_jobs: dict[
+            str, dict[Callable[[Homeduino], Awaitable[None]], bool]
+        ] = {}
+        self._jobs_run: dict[str, set[Callable[[Homeduino], Awaitable[None]]]] = {}
+        self._started: set[str] = set()
+        self._supervisors: dict[str, asyncio.Task] = {}
+        self._replays: dict[str, asyncio.Task] = {}
+        self._reconnects: dict[str, int] = {}
+        self._added_at: dict[str, float] = {}
+        self._time_to_ready: dict[str, float] = {}
+        # RF listeners indexed by (protocol, id, unit) and, for listeners that also
+        # want the all/group commands, by (protocol, id).
+        self._rf_listeners: dict[tuple, list[Callable[[dict], None]]] = {}
+        self._rf_group_listeners: dict[tuple, list[Callable[[dict], None]]] = {}
+        # Number of listeners and listeners ignoring group commands per unit,
+        # indexed by (protocol, id)
+        self._rf_units: dict[tuple, dict[int | None, list[int]]] = {}
+        # Automation triggers indexed by (protocol, id) and device triggers indexed
+        # by (protocol, id) and unit
+        self._rf_triggers: dict[tuple, list[Callable[[dict], None]]] = {}
+        self._rf_device_triggers: dict[
+            tuple, dict[int | None, list[Callable[[dict], None]]]
+        ] = {}
+
+        # Number of entity state writes skipped because nothing changed
+        self.suppressed_state_writes = 0
+
+        self._rf_reception_history = RFReceptionHistory()
+        self._rf_receive_log = RFReceiveLog(_LOGGER)
+        self._rf_receive_stats = RFReceiveStats()
+        self._rf_candidates = RFCandidateTable()
+        self._rf_deduplicator = RFDeduplicator(
+            RF_DEDUP_WINDOWS, on_reception=self._rf_reception
+        )
+
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._loaded = False
+        self._rf_adaptive_repeats = RFAdaptiveRepeats(self._async_schedule_save)
+        self._rf_routing_table = RFRoutingTable(self._async_schedule_save)
+
+    async def async_load(self) -> None:
+        """Load the learned RF device data from storage."""
+        if self._loaded:
+            return
+
+        self._loaded = True
+        if (data := await self._store.async_load()) is None:
+            return
+
+        for identifier, repeats in data.get("repeats", {}).items():
+            self._rf_adaptive_repeats.learned[_rf_key(identifier)] = repeats
+
+        for identifier, route in data.get("routes", {}).items():
+            self._rf_routing_table.learned[_rf_key(identifier)] = route
 
-    def add_transceiver(self, device_id, transceiver: Homeduino):
-        """Add a Homeduino transceiver."""
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the learned RF device data."""
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict:
+        """Return the learned RF device data to store."""
+        return {
+            "repeats": {
+                _rf_identifier(*key): repeats
+                for key, repeats in self._rf_adaptive_repeats.learned.items()
+            },
+            "routes": {
+                _rf_identifier(*key): route
+                for key, route in self._rf_routing_table.learned.items()
+            },
+        }
+
+    def add_transceiver(
+        self,
+        device_id,
+        transceiver: ConnectionTrackingHomeduino,
+        options=None,
+        setup_started: float | None = None,
+    ):
+        """Add a Homeduino transceiver.
+
+        The time to ready is measured from setup_started, the monotonic time the
+        setup of the transceiver started, e.g. before it was connected.
+        """
+        options = options or {}
 
         self._transceivers[device_id] = transceiver
-        transceiver.add_rf_receive_callback(self.rf_receive_callback)
+        self._rf_dedup_windows[device_id] = (
+            options.get(CONF_RF_DEDUP_WINDOW, DEFAULT_RF_DEDUP_WINDOW) / 1000
+        )
+        self._rf_noise_families[device_id] = frozenset(
+            options.get(CONF_RF_NOISE_FILTER, [])
+        )
+        self._rf_receive_log.set_capture_size(
+            device_id, options.get(CONF_RF_CAPTURE_SIZE, 0)
+        )
+        self._rf_noise_allowlists[device_id] = frozenset(
+            _rf_key(identifier)[:2]
+            for identifier in options.get(CONF_RF_NOISE_ALLOWLIST, [])
+        )
+        self._rf_events[device_id] = options.get(CONF_RF_EVENTS, CONF_RF_EVENTS_ALL)
+        self._rf_events_lists[device_id] = frozenset(
+            _rf_key(identifier)[:2]
+            for identifier in options.get(CONF_RF_EVENTS_LIST, [])
+        )
+
+        rf_transmit_queue = RFTransmitQueue(
+            device_id,
+            self.rf_group_units,
+            lambda protocol, values, repeats: self._async_transceiver_rf_send(
+                device_id,
+                transceiver,
+                lambda transceiver: transceiver.rf_send(protocol, values, repeats),
+            ),
+            options.get(CONF_RF_DUTY_CYCLE, DEFAULT_RF_DUTY_CYCLE) / 100,
+        )
+        self._rf_transmit_queues[device_id] = rf_transmit_queue
+        self._rf_transmit_tasks[device_id] = self.hass.async_create_background_task(
+            rf_transmit_queue.async_run(), f"{DOMAIN} transmit queue {device_id}"
+        )
+        transceiver.add_rf_receive_callback(
+            partial(self.rf_receive_callback, device_id)
+        )
+        transceiver.add_connection_callback(
+            partial(self._async_transceiver_connection, device_id)
+        )
+
+        self._pin_modes[device_id] = _transceiver_pin_modes(options)
+        self._replay_pin_modes[device_id] = _transceiver_pin_modes(options, True)
+        self._startup_jobs.setdefault(device_id, {})
+        self._jobs_run.setdefault(device_id, set())
+        self._added_at[device_id] = (
+            time.monotonic() if setup_started is None else setup_started
+        )
+
+        self.async_set_updated_data(None)
+
+    async def _async_connect_transceiver(self, device_id) -> None:
+        """Connect the transceiver, retrying with a jittered exponential backoff."""
+        transceiver = self._transceivers[device_id]
+        attempt = 0
+        while not transceiver.connected():
+            try:
+                if await transceiver.connect():
+                    break
+            except (HomeduinoError, serial.SerialException) as ex:
+                _LOGGER.debug("Unable to connect transceiver %s: %s", device_id, ex)
+
+            await asyncio.sleep(_reconnect_delay(attempt))
+            attempt += 1
+
+    async def _async_apply_startup_plan(
+        self,
+        device_id,
+        pin_modes: dict[int, HomeduinoPinMode],
+        jobs: tuple[Callable[[Homeduino], Awaitable[None]], ...],
+    ) -> None:
+        """Apply the pin modes followed by the startup jobs."""
+        transceiver = self._transceivers[device_id]
+
+        # The requests are queued on the serial line of the transceiver, bound the
+        # number of requests waiting for it
+        semaphore = asyncio.Semaphore(STARTUP_MAX_IN_FLIGHT)
+
+        async def async_run(request: Callable[[], Awaitable]) -> None:
+            async with semaphore:
+                try:
+                    await request()
+                except (HomeduinoError, serial.SerialException) as ex:
+                    _LOGGER.error("Failed to set up transceiver %s: %s", device_id, ex)
+
+        await asyncio.gather(
+            *(
+                async_run(partial(transceiver.pin_mode, digital_io, pin_mode))
+                for digital_io, pin_mode in pin_modes.items()
+            )
+        )
+        await asyncio.gather(*(async_run(partial(job, transceiver)) for job in jobs))
+        self._jobs_run[device_id].update(jobs)
+
+    async def async_start_transceiver(self, device_id) -> None:
+        """Connect the transceiver if needed and apply its startup plan.
+
+        The pin modes from the options are applied first, followed by the startup
+        jobs of the entities, e.g. restoring outputs and subscribing to inputs.
+        Afterwards the transceiver is supervised and reconnected when it stops
+        answering.
+        """
+        await self._async_connect_transceiver(device_id)
+        await self._async_apply_startup_plan(
+            device_id,
+            self._pin_modes[device_id],
+            tuple(self._startup_jobs[device_id]),
+        )
+
+        self._started.add(device_id)
+        self._connected.add(device_id)
+        self._time_to_ready[device_id] = time.monotonic() - self._added_at[device_id]
+        _LOGGER.info(
+            "Homeduino transceiver %s is ready in %.2f seconds",
+            device_id,
+            self._time_to_ready[device_id],
+        )
+
+        self.async_set_updated_data(None)
+
+        self._supervisors[device_id] = self.hass.async_create_background_task(
+            self._async_supervise_transceiver(device_id),
+            f"{DOMAIN} supervise transceiver {device_id}",
+        )
+
+    async def _async_ping_transceiver(self, device_id) -> bool:
+        """Test if the transceiver answers.
+
+        The homeduino library pings an idle transceiver itself, only ping when
+        nothing was received since the last check.
+        """
+        transceiver = self._transceivers[device_id]
+        if not transceiver.connected():
+            return False
+
+        last_message_received = transceiver.protocol.last_message_received
+        if (
+            last_message_received is not None
+            and (datetime.now() - last_message_received).total_seconds()
+            < SUPERVISOR_INTERVAL
+        ):
+            return True
+
+        try:
+            return await transceiver.ping()
+        except (HomeduinoError, serial.SerialException) as ex:
+            _LOGGER.debug("Unable to ping transceiver %s: %s", device_id, ex)
+
+        return False
+
+    async def _async_supervise_transceiver(self, device_id) -> None:
+        """Reconnect the transceiver when it misses pings.
+
+        The startup plan is replayed once the transceiver is connected again.
+        """
+        failed_pings = 0
+        while True:
+            await asyncio.sleep(SUPERVISOR_INTERVAL)
+            if await self._async_ping_transceiver(device_id):
+                failed_pings = 0
+                continue
+
+            failed_pings += 1
+            if failed_pings <= ALLOWED_FAILED_PINGS:
+                continue
+
+            _LOGGER.warning(
+                "Homeduino transceiver %s is not answering, reconnecting", device_id
+            )
+            self._started.discard(device_id)
+            self._connected.discard(device_id)
+            self.async_set_updated_data(None)
+
+            transceiver = self._transceivers[device_id]
+            try:
+                await transceiver.disconnect()
+            except (HomeduinoError, serial.SerialException) as ex:
+                _LOGGER.debug("Unable to disconnect transceiver %s: %s", device_id, ex)
+
+            await self._async_connect_transceiver(device_id)
+            failed_pings = 0
+
+    @callback
+    def _async_transceiver_connection(self, device_id, connected: bool) -> None:
+        """Handle a change of the connection of a transceiver.
+
+        A lost connection makes the transceiver unavailable right away. The
+        Arduino loses its configuration when it is reset or plugged in again.
+        After a reconnect, by the supervisor or by the homeduino library itself,
+        the startup plan is replayed.
+        """
+        if not connected:
+            if device_id in self._connected:
+                self._started.discard(device_id)
+                self._connected.discard(device_id)
+                self.async_set_updated_data(None)
+            return
+
+        if device_id not in self._supervisors:
+            # The first connect is handled by async_start_transceiver
+            return
+
+        self._started.discard(device_id)
+        self._connected.discard(device_id)
+        self._reconnects[device_id] = self._reconnects.get(device_id, 0) + 1
+        self.async_set_updated_data(None)
+
+        if (replay := self._replays.pop(device_id, None)) is not None:
+            replay.cancel()
+        self._replays[device_id] = self.hass.async_create_background_task(
+            self._async_replay_startup_plan(device_id),
+            f"{DOMAIN} replay startup plan {device_id}",
+        )
+
+    async def _async_replay_startup_plan(self, device_id) -> None:
+        """Apply the startup plan again after the transceiver reconnected.
+
+        The pin modes of the outputs and inputs and the startup jobs which can be
+        replayed are applied again, the entities are kept.
+        """
+        jobs_run = self._jobs_run[device_id]
+        await self._async_apply_startup_plan(
+            device_id,
+            self._replay_pin_modes[device_id],
+            tuple(
+                job
+                for job, replay in self._startup_jobs[device_id].items()
+                if replay or job not in jobs_run
+            ),
+        )
+
+        self._replays.pop(device_id, None)
+        self._started.add(device_id)
+        self._connected.add(device_id)
+        _LOGGER.info("Homeduino transceiver %s is reconnected", device_id)
 
         self.async_set_updated_data(None)
 
+    async def async_add_startup_job(
+        self,
+        device_id,
+        job: Callable[[Homeduino], Awaitable[None]],
+        replay: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Add a job to the startup plan of the transceiver.
+
+        The job is run immediately when the transceiver is already started,
+        returns a callback to remove the job. With replay the job is run again
+        after the transceiver is reconnected, otherwise it is only run once.
+        """
+        jobs = self._startup_jobs[device_id]
+        jobs[job] = replay
+
+        if device_id in self._started:
+            self._jobs_run[device_id].add(job)
+            await job(self._transceivers[device_id])
+
+        @callback
+        def remove_job() -> None:
+            jobs.pop(job, None)
+            self._jobs_run.get(device_id, set()).discard(job)
+
+        return remove_job
+
+    def rf_utilisation(self, device_id) -> float | None:
+        """Return the airtime used by the transceiver as fraction of the time."""
+        if (rf_transmit_queue := self._rf_transmit_queues.get(device_id)) is None:
+            return None
+
+        return rf_transmit_queue.airtime_budget.utilisation()
+
     def has_transceiver(self):
         return len(self._transceivers) > 0
 
     def get_transceiver(self, device_id):
         return self._transceivers.get(device_id)
 
-    def connected(self):
-        if not self.has_transceiver():
-            return False
+    def connected(self, device_id=None) -> bool:
+        """Return if the transceiver is connected, or any if no device id is given."""
+        if device_id is None:
+            return bool(self._connected)
+
+        return device_id in self._connected
+
+    @callback
+    def async_set_rf_availability(
+        self,
+        protocol: str,
+        id_: int,
+        unit: int | None,
+        policy: str,
+        device_id: str | None = None,
+    ) -> CALLBACK_TYPE:
+        """Configure when a RF device is available.
+
+        Returns a callback to remove the configured policy.
+        """
+        key = (protocol, id_, unit)
+        self._rf_availability[key] = (policy, device_id)
+
+        @callback
+        def remove_rf_availability() -> None:
+            self._rf_availability.pop(key, None)
+
+        return remove_rf_availability
+
+    @callback
+    def async_set_rf_group_commands(
+        self, protocol: str, id_: int, unit: int | None
+    ) -> CALLBACK_TYPE:
+        """Allow the commands of a RF device to be sent as all/group command.
+
+        Returns a callback to disallow it again.
+        """
+        key = (protocol, id_, unit)
+        self._rf_group_commands.add(key)
+
+        @callback
+        def remove_rf_group_commands() -> None:
+            self._rf_group_commands.discard(key)
+
+        return remove_rf_group_commands
+
+    def rf_available(self, protocol: str, id_: int, unit: int | None = None) -> bool:
+        """Return if a RF device is available according to its policy.
 
-        for transceiver in self._transceivers.values():
-            return transceiver.connected()
+        By default a RF device is available when any transceiver is connected.
+        """
+        policy, device_id = self._rf_availability.get(
+            (protocol, id_, unit), (CONF_RF_AVAILABILITY_ANY, None)
+        )
+        if policy == CONF_RF_AVAILABILITY_ALL:
+            return bool(self._connected) and len(self._connected) == len(
+                self._transceivers
+            )
+        if policy == CONF_RF_AVAILABILITY_TRANSCEIVER and device_id is not None:
+            return device_id in self._connected
+
+        return bool(self._connected)
+
+    def get_diagnostics(self) -> dict:
+        """Return the coordinator statistics for diagnostics."""
+        return {
+            "transceivers": {
+                device_id: {
+                    "connected": transceiver.connected(),
+                    "time_to_ready": self._time_to_ready.get(device_id),
+                    "reconnects": self._reconnects.get(device_id, 0),
+                    "rf_captures": self._rf_receive_log.captures(device_id),
+                    "transmit_queue": self._rf_transmit_queues[
+                        device_id
+                    ].get_diagnostics(),
+                }
+                for device_id, transceiver in self._transceivers.items()
+            },
+            "rf_listeners": sum(len(x) for x in self._rf_listeners.values()),
+            "rf_group_listeners": sum(
+                len(x) for x in self._rf_group_listeners.values()
+            ),
+            "suppressed_state_writes": self.suppressed_state_writes,
+            "rf_receive": self._rf_receive_stats.as_dict(),
+            "rf_duplicates": dict(self._rf_deduplicator.duplicates),
+            "rf_merged": dict(self._rf_deduplicator.merged),
+            "rf_noise_dropped": dict(self.rf_noise_dropped),
+            "rf_log_suppressed": self._rf_receive_log.suppressed,
+            "rf_events_fired": self.rf_events_fired,
+            "rf_events_skipped": self.rf_events_skipped,
+            "rf_triggers": sum(len(x) for x in self._rf_triggers.values()),
+            "rf_device_triggers": sum(
+                len(x)
+                for units in self._rf_device_triggers.values()
+                for x in units.values()
+            ),
+            "rf_receptions": {
+                _rf_identifier(*key): counts
+                for key, counts in self._rf_reception_history.as_dict().items()
+            },
+            "rf_candidates": {
+                _rf_identifier(*key): {
+                    "hits": candidate.hits,
+                    "last_seen": round(time.monotonic() - candidate.last_seen, 1),
+                    "discovered": candidate.discovered,
+                }
+                for key, candidate in self._rf_candidates.as_dict().items()
+            },
+            "rf_discoveries": self._rf_candidates.discoveries,
+            "rf_discoveries_rate_limited": self._rf_candidates.rate_limited,
+            "rf_routes": {
+                _rf_identifier(*key): route
+                for key, route in self._rf_routing_table.as_dict().items()
+            },
+            "rf_adaptive_repeats": self._data_to_save()["repeats"],
+        }
 
     async def remove_transceiver(self, device_id):
         transceiver = self._transceivers.get(device_id)
-        if transceiver is not None and await transceiver.disconnect():
-            self._transceivers.pop(device_id)
+        if transceiver is None:
+            return
+
+        if (supervisor := self._supervisors.pop(device_id, None)) is not None:
+            supervisor.cancel()
+        if (replay := self._replays.pop(device_id, None)) is not None:
+            replay.cancel()
+
+        if not await transceiver.disconnect():
+            return
+
+        self._transceivers.pop(device_id)
+        self._rf_dedup_windows.pop(device_id, None)
+        self._rf_noise_families.pop(device_id, None)
+        self._rf_noise_allowlists.pop(device_id, None)
+        self._rf_events.pop(device_id, None)
+        self._rf_events_lists.pop(device_id, None)
+        self._rf_receive_log.set_capture_size(device_id, 0)
+        self._rf_transmit_queues.pop(device_id, None)
+        if (
+            rf_transmit_task := self._rf_transmit_tasks.pop(device_id, None)
+        ) is not None:
+            rf_transmit_task.cancel()
+        self._pin_modes.pop(device_id, None)
+        self._replay_pin_modes.pop(device_id, None)
+        self._startup_jobs.pop(device_id, None)
+        self._jobs_run.pop(device_id, None)
+        self._started.discard(device_id)
+        self._connected.discard(device_id)
+        self._reconnects.pop(device_id, None)
+        self._added_at.pop(device_id, None)
+        self._time_to_ready.pop(device_id, None)
+
+        self.async_set_updated_data(None)
 
     @callback
-    def rf_receive_callback(self, decoded) -> None:
-        """Handle received messages."""
-        _LOGGER.info(
-            "RF Protocol: %s Values: %s",
-            decoded["protocol"],
-            json.dumps(decoded["values"]),
+    def async_add_rf_listener(
+        self,
+        rf_listener: Callable[[dict], None],
+        protocol: str,
+        id_: int,
+        unit: int | None = None,
+        group: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Listen for RF packets addressed to the given protocol, id and unit.
+
+        If group is set the listener also receives the all/group commands for the id.
+        """
+        key = (protocol, id_, unit)
+        self._rf_listeners.setdefault(key, []).append(rf_listener)
+        self._rf_candidates.discard(key)
+        if group:
+            self._rf_group_listeners.setdefault(key[:2], []).append(rf_listener)
+
+        unit_listeners = self._rf_units.setdefault(key[:2], {}).setdefault(unit, [0, 0])
+        unit_listeners[0] += 1
+        unit_listeners[1] += 0 if group else 1
+
+        @callback
+        def remove_rf_listener() -> None:
+            units = self._rf_units.get(key[:2], {})
+            if (unit_listeners := units.get(unit)) is not None:
+                unit_listeners[0] -= 1
+                unit_listeners[1] -= 0 if group else 1
+                if unit_listeners[0] <= 0:
+                    del units[unit]
+                    if not units:
+                        del self._rf_units[key[:2]]
+
+            for index, index_key in (
+                (self._rf_listeners, key),
+                (self._rf_group_listeners, key[:2]),
+            ):
+                rf_listeners = index.get(index_key)
+                if rf_listeners is not None and rf_listener in rf_listeners:
+                    rf_listeners.remove(rf_listener)
+                    if not rf_listeners:
+                        del index[index_key]
+
+        return remove_rf_listener
+
+    @callback
+    def async_add_rf_trigger(
+        self, rf_trigger: Callable[[dict], None], protocol: str, id_: int
+    ) -> CALLBACK_TYPE:
+        """Call an automation trigger for RF packets of the given protocol and id.
+
+        Unlike the homeduino_event bus event only the triggers of the received
+        (protocol, id) are called.
+        """
+        key = (protocol, id_)
+        self._rf_triggers.setdefault(key, []).append(rf_trigger)
+
+        @callback
+        def remove_rf_trigger() -> None:
+            rf_triggers = self._rf_triggers.get(key)
+            if rf_triggers is not None and rf_trigger in rf_triggers:
+                rf_triggers.remove(rf_trigger)
+                if not rf_triggers:
+                    del self._rf_triggers[key]
+
+        return remove_rf_trigger
+
+    @callback
+    def async_add_rf_device_trigger(
+        self,
+        rf_trigger: Callable[[dict], None],
+        protocol: str,
+        id_: int,
+        unit: int | None = None,
+    ) -> CALLBACK_TYPE:
+        """Call a device trigger for RF packets of the given protocol, id and unit.
+
+        Device triggers are not entity listeners, they are not counted as units of
+        the id when sending group commands.
+        """
+        key = (protocol, id_)
+        units = self._rf_device_triggers.setdefault(key, {})
+        units.setdefault(unit, []).append(rf_trigger)
+
+        @callback
+        def remove_rf_device_trigger() -> None:
+            rf_triggers = units.get(unit)
+            if rf_triggers is not None and rf_trigger in rf_triggers:
+                rf_triggers.remove(rf_trigger)
+                if not rf_triggers:
+                    del units[unit]
+                if not units and self._rf_device_triggers.get(key) is units:
+                    del self._rf_device_triggers[key]
+
+        return remove_rf_device_trigger
+
+    def rf_group_units(
+        self, protocol: str, id_: int, opted_in: bool = True
+    ) -> set | None:
+        """Return the configured units of an id if all of them accept group commands.
+
+        Unless opted_in is cleared all units also need group commands enabled in
+        their options.
+        """
+        units = self._rf_units.get((protocol, id_))
+        if not units or any(non_group for _, non_group in units.values()):
+            return None
+
+        if opted_in and any(
+            (protocol, id_, unit) not in self._rf_group_commands for unit in units
+        ):
+            return None
+
+        return set(units)
+
+    @callback
+    def _async_dispatch_rf(self, decoded) -> bool:
+        """Forward a decoded RF packet to the listeners it is addressed to.
+
+        Returns False if there are no listeners for the packet.
+        """
+        protocol = decoded["protocol"]
+        values = decoded["values"]
+
+        rf_listeners = self._rf_listeners.get(
+            (protocol, values.get("id"), values.get("unit")), ()
         )
-        self.async_set_updated_data(decoded)
+        if values.get("all", False) is True:
+            group_listeners = self._rf_group_listeners.get((protocol, values.get("id")))
+            if group_listeners:
+                # A listener can be registered in both indexes, only call it once
+                rf_listeners = dict.fromkeys((*rf_listeners, *group_listeners))
 
-        event_data = {**{"protocol": decoded["protocol"]}, **decoded["values"]}
-        self.hass.bus.async_fire(f"{DOMAIN}_event", event_data)
+        for rf_listener in tuple(rf_listeners):
+            rf_listener(decoded)
 
-    async def rf_send(self, protocol: str, values, repeats=DEFAULT_REPEATS):
-        if not self.has_transceiver():
+        return bool(rf_listeners)
+
+    @callback
+    def _async_trigger_rf(self, decoded) -> bool:
+        """Call the automation and device triggers of a decoded RF packet.
+
+        Returns False if there are no triggers for the packet.
+        """
+        values = decoded["values"]
+        key = (decoded["protocol"], values.get("id"))
+
+        rf_triggers = self._rf_triggers.get(key, ())
+        if (units := self._rf_device_triggers.get(key)) is not None:
+            rf_triggers = (*rf_triggers, *units.get(values.get("unit"), ()))
+        for rf_trigger in rf_triggers:
+            rf_trigger(decoded)
+
+        return bool(rf_triggers)
+
+    @callback
+    def _async_rf_candidate(self, decoded) -> None:
+        """Discover a RF device which is not configured."""
+        protocol = decoded["protocol"]
+        values = decoded["values"]
+        if values.get("id") is None or protocol not in protocol_catalogue().protocols:
+            return
+
+        key = (protocol, values["id"], values.get("unit"))
+        if not self._rf_candidates.hit(key):
+            return
+
+        _LOGGER.debug("Discovered RF device %s", _rf_identifier(*key))
+        discovery_flow.async_create_flow(
+            self.hass,
+            DOMAIN,
+            context={"source": SOURCE_INTEGRATION_DISCOVERY},
+            data={CONF_RF_PROTOCOL: key[0], CONF_RF_ID: key[1], CONF_RF_UNIT: key[2]},
+        )
+
+    @callback
+    def _rf_reception(self, protocol: str, values: dict, device_id: str) -> None:
+        """Record which transceiver heard a RF device and learn its route."""
+        key = (protocol, values.get("id"), values.get("unit"))
+        self._rf_reception_history.add(key, device_id)
+        # Only learn routes of configured devices, noise would grow the table
+        if key[:2] in self._rf_units:
+            self._rf_routing_table.learn(key, self._rf_reception_history.get(key))
+
+    @callback
+    def async_set_rf_route(
+        self, protocol: str, id_: int, unit: int | None, device_id: str | None
+    ) -> CALLBACK_TYPE:
+        """Configure the transceiver to send with to a RF device.
+
+        Returns a callback to remove the configured route.
+        """
+        return self._rf_routing_table.configure((protocol, id_, unit), device_id)
+
+    @callback
+    def _rf_is_noise(self, device_id, decoded) -> bool:
+        """Test if a packet is noise which should not be dispatched.
+
+        Packets of the filtered protocol families pass when the (protocol, id) is
+        configured, has automation or device triggers, is allowlisted or is a
+        discovered candidate. Other packets are only counted as discovery
+        candidate.
+        """
+        protocol = decoded["protocol"]
+        families = self._rf_noise_families.get(device_id)
+        if not families or protocol_family(protocol) not in families:
             return False
 
-        success = False
-        for transceiver in self._transceivers.values():
-            if not transceiver.supports_rf_send():
-                continue
+        values = decoded["values"]
+        key = (protocol, values.get("id"))
+        if (
+            key in self._rf_units
+            or key in self._rf_triggers
+            or key in self._rf_device_triggers
+            or key in self._rf_noise_allowlists[device_id]
+            or self._rf_candidates.is_discovered((*key, values.get("unit")))
+        ):
+            return False
 
-            if not transceiver.connected() and not await transceiver.connect():
-                continue
+        self._async_rf_candidate(decoded)
+        self.rf_noise_dropped[protocol] = self.rf_noise_dropped.get(protocol, 0) + 1
+        return True
 
-            if await transceiver.rf_send(protocol, values, repeats):
-                self.async_set_updated_data({"protocol": protocol, "values": values})
+    @callback
+    def rf_receive_callback(self, device_id, decoded) -> None:
+        """Handle received messages."""
+        if device_id not in self._transceivers:
+            # Ignore callbacks of a transceiver which was already removed
+            return
 
-                success = True
+        start = time.perf_counter()
+        handled = self._async_rf_receive(device_id, decoded)
+        self._rf_receive_stats.add(time.perf_counter() - start, handled)
 
-        return success
+    @callback
+    def _async_rf_receive(self, device_id, decoded) -> bool:
+        """Handle a received RF packet.
 
-    async def raw_rf_send(self, command: str, repeats=DEFAULT_REPEATS):
-        if not self.has_transceiver():
+        Returns False if the packet is dropped as noise or duplicate. Noise is
+        dropped first, so it does not fill the de-duplication window.
+        """
+        if self._rf_is_noise(device_id, decoded):
             return False
 
-        success = False
-        for transceiver in self._transceivers.values():
-            if not transceiver.supports_rf_send():
-                continue
+        if self._rf_deduplicator.is_duplicate(
+            decoded["protocol"],
+            decoded["values"],
+            self._rf_dedup_windows.get(device_id, DEFAULT_RF_DEDUP_WINDOW / 1000),
+            device_id,
+        ):
+            return False
 
-            if not transceiver.connected() and not await transceiver.connect():
-                continue
+        values = decoded["values"]
+        self._rf_adaptive_repeats.received(
+            (decoded["protocol"], values.get("id"), values.get("unit")), values
+        )
 
-            if await transceiver.raw_rf_send(command, repeats) == "ACK":
-                success = True
+        self._rf_receive_log.log(device_id, decoded["protocol"], values)
+        claimed = self._async_dispatch_rf(decoded)
+        claimed = self._async_trigger_rf(decoded) or claimed
+        if not claimed:
+            self._async_rf_candidate(decoded)
 
-        return success
+        if not self._rf_fire_event(device_id, decoded, claimed):
+            self.rf_events_skipped += 1
+            return True
+
+        self.rf_events_fired += 1
+        self.hass.bus.async_fire(
+            f"{DOMAIN}_event", {"protocol": decoded["protocol"], **values}
+        )
+        return True
+
+    def _rf_fire_event(self, device_id, decoded, claimed: bool) -> bool:
+        """Test if a received packet should be fired as homeduino_event."""
+        rf_events = self._rf_events.get(device_id, CONF_RF_EVENTS_ALL)
+        if rf_events == CONF_RF_EVENTS_ALL:
+            return True
+        if rf_events == CONF_RF_EVENTS_UNCLAIMED:
+            return not claimed
+
+        return (decoded["protocol"], decoded["values"].get("id")) in (
+            self._rf_events_lists[device_id]
+        )
+
+    async def _async_transceiver_rf_send(
+        self, device_id, transceiver: Homeduino, rf_send
+    ) -> bool:
+        """Send with a single transceiver, bounded by its own timeout."""
+        try:
+            async with asyncio.timeout(RF_SEND_TIMEOUT):
+                # Reconnecting is left to the supervisor, fail fast meanwhile
+                if not transceiver.connected():
+                    return False
+
+                return await rf_send(transceiver)
+        except TimeoutError:
+            _LOGGER.error("Timeout while sending with transceiver %s", device_id)
+        except (HomeduinoError, serial.SerialException) as ex:
+            _LOGGER.error("Failed to send with transceiver %s: %s", device_id, ex)
+
+        return False
+
+    def _rf_send_transceivers(self) -> list[str]:
+        """Return the device IDs of the transceivers that support RF send."""
+        return [
+            device_id
+            for device_id, transceiver in self._transceivers.items()
+            if transceiver.supports_rf_send()
+        ]
+
+    async def _async_rf_send_all(
+        self,
+        rf_send,
+        key: tuple | None,
+        priority: int,
+        frame: tuple | None = None,
+        airtime: float = 0.0,
+        device_ids: list[str] | None = None,
+    ) -> dict[str, bool]:
+        """Send concurrently with all transceivers that support RF send.
+
+        The command is queued in the transmit queue of every transceiver, or of
+        the given transceivers, returns the result per transceiver device ID.
+        """
+        if device_ids is None:
+            device_ids = self._rf_send_transceivers()
+        results = await asyncio.gather(
+            *(
+                self._rf_transmit_queues[device_id].async_send(
+                    key,
+                    partial(
+                        self._async_transceiver_rf_send,
+                        device_id,
+                        self._transceivers[device_id],
+                        rf_send,
+                    ),
+                    priority,
+                    frame,
+                    airtime,
+                )
+                for device_id in device_ids
+            )
+        )
+
+        return dict(zip(device_ids, results))
+
+    async def rf_send_results(
+        self,
+        protocol: str,
+        values,
+        repeats=DEFAULT_REPEATS,
+        priority: int = PRIORITY_AUTOMATION,
+    ) -> dict[str, bool]:
+        """Send a RF command and return the result per transceiver.
+
+        A queued command for the same protocol, id and unit which is not yet sent
+        is superseded by this command.
+
+        A device with a route is sent to with its preferred transceiver only. When
+        that fails the fallback transceivers of the route are used and finally the
+        command is broadcast with all other transceivers.
+        """
+        rf_send_all = partial(
+            self._async_rf_send_all,
+            lambda transceiver: transceiver.rf_send(protocol, values, repeats),
+            (protocol, values.get("id"), values.get("unit"), values.get("all", False)),
+            priority,
+            (protocol, values, repeats),
+            rf_airtime(protocol, values, repeats),
+        )
+
+        device_ids = self._rf_send_transceivers()
+        route = self._rf_routing_table.route(
+            (protocol, values.get("id"), values.get("unit")), device_ids
+        )
+        if not route:
+            results = await rf_send_all()
+        else:
+            results = await rf_send_all(route[:1])
+            for fallback in (
+                route[1:],
+                [device_id for device_id in device_ids if device_id not in route],
+            ):
+                if any(results.values()) or not fallback:
+                    continue
+                results |= await rf_send_all(fallback)
+
+        if any(results.values()):
+            self._rf_adaptive_repeats.sent(
+                (protocol, values.get("id"), values.get("unit")), values, repeats
+            )
+            self._async_dispatch_rf({"protocol": protocol, "values": values})
+
+        return results
+
+    def rf_adaptive_repeats(
+        self, protocol: str, id_: int, unit: int | None, repeats: int
+    ) -> int:
+        """Return the learned number of repeats for a RF device.
+
+        The configured repeats are used until the device is learned.
+        """
+        return self._rf_adaptive_repeats.repeats((protocol, id_, unit), repeats)
+
+    async def rf_send(
+        self,
+        protocol: str,
+        values,
+        repeats=DEFAULT_REPEATS,
+        priority: int = PRIORITY_AUTOMATION,
+    ) -> bool:
+        results = await self.rf_send_results(protocol, values, repeats, priority)
+        return any(results.values())
+
+    async def rf_send_batch(
+        self,
+        commands: list[tuple[str, dict]],
+        repeats=DEFAULT_REPEATS,
+        group: bool = False,
+    ) -> dict[str, bool]:
+        """Send a batch of RF commands as one transmission plan.
+
+        If group is set the commands for all configured units of an id are sent as
+        a single all/group command when possible.
+
+        Returns per transceiver if all frames of the plan were sent.
+        """
+        results = {}
+        for frames in plan_rf_batch(
+            commands,
+            repeats,
+            partial(self.rf_group_units, opted_in=False) if group else None,
+        ):
+            for frame_results in await asyncio.gather(
+                *(
+                    self.rf_send_results(protocol, values, frame_repeats, PRIORITY_BULK)
+                    for protocol, values, frame_repeats in frames
+                )
+            ):
+                for device_id, success in frame_results.items():
+                    results[device_id] = results.get(device_id, True) and success
+
+        return results
+
+    async def raw_rf_send_results(
+        self,
+        command: str,
+        repeats=DEFAULT_REPEATS,
+        priority: int = PRIORITY_AUTOMATION,
+    ) -> dict[str, bool]:
+        """Send a raw RF command and return the result per transceiver."""
+        return await self._async_rf_send_all(
+            lambda transceiver: transceiver.raw_rf_send(command, repeats),
+            None,
+            priority,
+            airtime=raw_rf_airtime(command, repeats),
+        )
+
+    async def raw_rf_send(
+        self,
+        command: str,
+        repeats=DEFAULT_REPEATS,
+        priority: int = PRIORITY_AUTOMATION,
+    ) -> bool:
+        results = await self.raw_rf_send_results(command, repeats, priority)
+        return any(results.values())
 
     async def send(self, config_entry_id, command):
         if not self.has_transceiver():
@@ -188,12 +1200,22 @@ class HomeduinoCoordinator(DataUpdateCoordinator):
         if transceiver is None:
             return False
 
-        if not transceiver.connected() and not await transceiver.connect():
+        if not transceiver.connected():
             return False
 
         return await transceiver.send(command)
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Homeduino integration."""
+    homeduino_coordinator = HomeduinoCoordinator.instance(hass)
+    await homeduino_coordinator.async_load()
+
+    async_setup_services(hass, homeduino_coordinator)
+
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Homeduino from a config entry."""
     homeduino_coordinator = HomeduinoCoordinator.instance(hass)
@@ -201,6 +1223,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     entry_type = entry.data.get(CONF_ENTRY_TYPE)
     if entry_type == CONF_ENTRY_TYPE_TRANSCEIVER:
         # Set up Homeduino 433 MHz RF transceiver
+        setup_started = time.monotonic()
         try:
             serial_port = entry.data.get(CONF_SERIAL_PORT)
             receive_pin = None
@@ -212,14 +1235,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 elif value == CONF_IO_RF_SEND:
                     send_pin = digital_io
 
-            homeduino = Homeduino(
+            homeduino = create_homeduino(
                 serial_port,
                 entry.options.get(CONF_BAUD_RATE, DEFAULT_BAUD_RATE),
                 receive_pin,
                 send_pin,
             )
 
-            if not await homeduino.connect():
+            # With fast startup the transceiver is connected in the background
+            if (
+                not entry.options.get(CONF_FAST_STARTUP, False)
+                and not await homeduino.connect()
+            ):
                 raise ConfigEntryNotReady(f"Unable to connect to device {serial_port}")
 
             # Create the device if not exists
@@ -232,7 +1259,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 model="transceiver",
             )
 
-            homeduino_coordinator.add_transceiver(device.id, homeduino)
+            homeduino_coordinator.add_transceiver(
+                device.id, homeduino, entry.options, setup_started
+            )
 
             entry.runtime_data = device.id
 
@@ -246,82 +1275,48 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 f"Unable to connect to Homeduino transceiver on {serial_port}"
             ) from ex
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-
-    entry.async_on_unload(entry.add_update_listener(update_listener))
-
-    async def async_handle_send(call: ServiceCall):
-        """Handle the service call."""
-        device_id: str = call.data.get(CONF_SERVICE_DEVICE_ID)
-        command: str = call.data.get(CONF_SERVICE_COMMAND)
-
-        return await HomeduinoCoordinator.instance(hass).send(
-            device_id, command.strip()
+    elif entry_type == CONF_ENTRY_TYPE_RF_DEVICE:
+        unit = entry.data.get(CONF_RF_UNIT)
+        entry.async_on_unload(
+            homeduino_coordinator.async_set_rf_route(
+                entry.data.get(CONF_RF_PROTOCOL),
+                int(entry.data.get(CONF_RF_ID)),
+                int(unit) if unit is not None else None,
+                entry.options.get(CONF_RF_TRANSCEIVER),
+            )
         )
-
-    async def async_handle_rf_send(call: ServiceCall):
-        """Handle the service call."""
-        protocol: str = call.data.get(CONF_SERVICE_PROTOCOL)
-        id_: int = int(call.data.get(CONF_SERVICE_ID))
-        unit: int = int(call.data.get(CONF_SERVICE_UNIT))
-        state: bool = bool(call.data.get(CONF_SERVICE_STATE))
-        all_: bool = bool(call.data.get(CONF_SERVICE_ALL))
-        repeats: int = int(call.data.get(CONF_SERVICE_REPEATS, DEFAULT_REPEATS))
-
-        return await HomeduinoCoordinator.instance(hass).rf_send(
-            protocol, {"id": id_, "unit": unit, "state": state, "all": all_}, repeats
+        entry.async_on_unload(
+            homeduino_coordinator.async_set_rf_availability(
+                entry.data.get(CONF_RF_PROTOCOL),
+                int(entry.data.get(CONF_RF_ID)),
+                int(unit) if unit is not None else None,
+                entry.options.get(CONF_RF_AVAILABILITY, CONF_RF_AVAILABILITY_ANY),
+                entry.options.get(CONF_RF_TRANSCEIVER),
+            )
         )
-
-    async def async_handle_raw_rf_send(call: ServiceCall):
-        """Handle the service call."""
-        command: str = call.data.get(CONF_SERVICE_COMMAND)
-        repeats: int = int(call.data.get(CONF_SERVICE_REPEATS, DEFAULT_REPEATS))
-
-        return await HomeduinoCoordinator.instance(hass).raw_rf_send(command, repeats)
-
-    hass.services.async_register(
-        DOMAIN, "send", async_handle_send, schema=SERVICE_SEND_SCHEMA
-    )
-
-    protocol_names = Homeduino.get_protocols()
-    protocol_names = [
-        protocol_name
-        for protocol_name in protocol_names
-        if protocol_name.startswith(("contact", "dimmer", "pir", "switch", "weather"))
-    ]
-
-    _service_rf_send_schema = vol.Schema(
-        {
-            vol.Required(CONF_SERVICE_PROTOCOL, default=""): SelectSelector(
-                SelectSelectorConfig(
-                    options=protocol_names,
-                    mode=SelectSelectorMode.DROPDOWN,
+        if entry.options.get(CONF_RF_GROUP_COMMANDS, False):
+            entry.async_on_unload(
+                homeduino_coordinator.async_set_rf_group_commands(
+                    entry.data.get(CONF_RF_PROTOCOL),
+                    int(entry.data.get(CONF_RF_ID)),
+                    int(unit) if unit is not None else None,
                 )
-            ),
-            vol.Required(CONF_SERVICE_ID): NumberSelector(
-                NumberSelectorConfig(min=0, mode=NumberSelectorMode.BOX)
-            ),
-            vol.Required(CONF_SERVICE_UNIT): NumberSelector(
-                NumberSelectorConfig(min=0, mode=NumberSelectorMode.BOX)
-            ),
-            vol.Required(CONF_SERVICE_STATE): cv.boolean,
-            vol.Optional(CONF_SERVICE_ALL): BooleanSelector(),
-            vol.Optional(CONF_SERVICE_REPEATS, default=DEFAULT_REPEATS): NumberSelector(
-                NumberSelectorConfig(min=1, mode=NumberSelectorMode.BOX)
-            ),
-        }
-    )
-
-    hass.services.async_register(
-        DOMAIN, "rf_send", async_handle_rf_send, schema=_service_rf_send_schema
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        "raw_rf_send",
-        async_handle_raw_rf_send,
-        schema=SERVICE_RAW_RF_SEND_SCHEMA,
-    )
+            )
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    if entry_type == CONF_ENTRY_TYPE_TRANSCEIVER:
+        # Apply the startup plan once all entities added their jobs
+        if entry.options.get(CONF_FAST_STARTUP, False):
+            entry.async_create_background_task(
+                hass,
+                homeduino_coordinator.async_start_transceiver(entry.runtime_data),
+                f"{DOMAIN} start transceiver {entry.runtime_data}",
+            )
+        else:
+            await homeduino_coordinator.async_start_transceiver(entry.runtime_data)
+
+    entry.async_on_unload(entry.add_update_listener(update_listener))
 
     return True
 
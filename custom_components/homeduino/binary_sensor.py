@@ -13,10 +13,12 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeduino import Homeduino
 
 from . import HomeduinoCoordinator
 from .const import (
@@ -31,6 +33,7 @@ from .const import (
     CONF_SERIAL_PORT,
     DOMAIN,
 )
+from .protocols import LOW_BATTERY_PROTOCOLS, protocol_catalogue
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -69,7 +72,13 @@ async def async_setup_entry(
                         coordinator, device_info, entity_description
                     )
                 )
-    elif entry_type == CONF_ENTRY_TYPE_RF_DEVICE:
+    elif (
+        entry_type == CONF_ENTRY_TYPE_RF_DEVICE
+        and Platform.BINARY_SENSOR
+        in protocol_catalogue().protocol_platforms(
+            config_entry.data.get(CONF_RF_PROTOCOL)
+        )
+    ):
         protocol = config_entry.data.get(CONF_RF_PROTOCOL)
         id = int(config_entry.data.get(CONF_RF_ID))
         unit = config_entry.data.get(CONF_RF_UNIT)
@@ -85,28 +94,29 @@ async def async_setup_entry(
             name=config_entry.title,
         )
 
-        if protocol.startswith(("contact", "pir")):
-            # Determine device_class based on protocol
-            device_class = None
-            if protocol.startswith("contact"):
-                device_class = BinarySensorDeviceClass.DOOR
-            elif protocol.startswith("pir"):
-                device_class = BinarySensorDeviceClass.MOTION
+        # Determine device_class based on protocol
+        families = protocol_catalogue().families
+        device_class = None
+        if protocol in families.get("contact", ()):
+            device_class = BinarySensorDeviceClass.DOOR
+        elif protocol in families.get("pir", ()):
+            device_class = BinarySensorDeviceClass.MOTION
 
+        if device_class is not None:
             entity_description = HomeduinoRFBinarySensorEntityDescription(
                 key=identifier,
                 device_class=device_class,
                 protocol=protocol,
                 id=id,
                 unit=unit,
-                inverted=protocol.startswith("contact"),
+                inverted=device_class == BinarySensorDeviceClass.DOOR,
             )
 
             entities.append(
                 HomeduinoRFBinarySensor(coordinator, device_info, entity_description)
             )
 
-        if protocol in ["contact4", "weather4", "weather5", "weather7", "weather13"]:
+        if protocol in LOW_BATTERY_PROTOCOLS:
             entity_description = HomeduinoRFBinarySensorEntityDescription(
                 key=identifier,
                 device_class=BinarySensorDeviceClass.BATTERY,
@@ -161,16 +171,31 @@ class HomeduinoTransceiverBinarySensor(CoordinatorEntity, BinarySensorEntity):
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
 
-        homeduino = self.coordinator.get_transceiver(self.device_entry.id)
+        self.async_on_remove(
+            await self.coordinator.async_add_startup_job(
+                self.device_entry.id, self._async_setup_io
+            )
+        )
+
+        self.async_write_ha_state()
+
+    async def _async_setup_io(self, homeduino: Homeduino) -> None:
+        """Subscribe to the digital input."""
         await homeduino.add_digital_read_callback(
             self.entity_description.digital_io, self._handle_digital_read_update
         )
 
-        if homeduino.connected():
-            self._attr_available = True
-
+        self._attr_available = True
         self.async_write_ha_state()
 
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        if not self._attr_available:
+            return self._attr_available
+
+        return self.coordinator.connected(self.device_entry.id)
+
     @callback
     def _handle_digital_read_update(self, value) -> None:
         self._attr_is_on = value
@@ -208,7 +233,20 @@ class HomeduinoRFBinarySensor(CoordinatorEntity, BinarySensorEntity):
         # if (last_state := await self.async_get_last_state()) is not None:
         #     self._attr_is_on = last_state.state == STATE_ON
 
-        if self.coordinator.connected():
+        self.async_on_remove(
+            self.coordinator.async_add_rf_listener(
+                self._handle_rf_receive,
+                self.entity_description.protocol,
+                self.entity_description.id,
+                self.entity_description.unit,
+            )
+        )
+
+        if self.coordinator.rf_available(
+            self.entity_description.protocol,
+            self.entity_description.id,
+            self.entity_description.unit,
+        ):
             self._attr_available = True
 
         self.async_write_ha_state()
@@ -216,44 +254,33 @@ class HomeduinoRFBinarySensor(CoordinatorEntity, BinarySensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if not self.coordinator.connected():
-            self._attr_available = False
-        else:
-            self._attr_available = True
-            self.async_write_ha_state()
-
-            if not self.coordinator.data:
-                return
-
-            if (
-                self.coordinator.data.get("protocol")
-                != self.entity_description.protocol
-            ):
-                return
-
-            if (
-                self.coordinator.data.get("values", {}).get("id")
-                != self.entity_description.id
-            ):
-                return
-
-            if (
-                self.coordinator.data.get("values", {}).get("unit")
-                != self.entity_description.unit
-            ):
-                return
-
-            _LOGGER.debug(self.coordinator.data)
-
-            is_on = self.coordinator.data.get("values", {}).get(
-                self.entity_description.field
-                if self.entity_description.field
-                else "state"
-            )
+        available = self.coordinator.rf_available(
+            self.entity_description.protocol,
+            self.entity_description.id,
+            self.entity_description.unit,
+        )
+        if available == self._attr_available:
+            self.coordinator.suppressed_state_writes += 1
+            return
+
+        self._attr_available = available
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_rf_receive(self, decoded) -> None:
+        """Handle a RF packet addressed to this binary sensor."""
+        _LOGGER.debug(decoded)
+
+        is_on = decoded["values"].get(
+            self.entity_description.field if self.entity_description.field else "state"
+        )
 
-            if self.entity_description.inverted:
-                is_on = not is_on
+        if self.entity_description.inverted:
+            is_on = not is_on
 
-            self._attr_is_on = is_on
+        if is_on == self._attr_is_on:
+            self.coordinator.suppressed_state_writes += 1
+            return
 
+        self._attr_is_on = is_on
         self.async_write_ha_state()
@@ -2,6 +2,7 @@
 
 import logging
 import os
+import re
 from typing import Any
 
 import serial.tools.list_ports
@@ -15,6 +16,8 @@ from homeassistant.config_entries import (
 from homeassistant.core import callback
 from homeassistant.helpers.selector import (
     BooleanSelector,
+    DeviceSelector,
+    DeviceSelectorConfig,
     NumberSelector,
     NumberSelectorConfig,
     NumberSelectorMode,
@@ -23,13 +26,13 @@ from homeassistant.helpers.selector import (
     SelectSelectorConfig,
     SelectSelectorMode,
 )
+from homeassistant.helpers.typing import DiscoveryInfoType
 from homeduino import (
     BAUD_RATES,
     DEFAULT_BAUD_RATE,
     DEFAULT_RECEIVE_PIN,
     DEFAULT_REPEATS,
     DEFAULT_SEND_PIN,
-    Homeduino,
     HomeduinoNotReadyError,
     HomeduinoResponseTimeoutError,
 )
@@ -41,6 +44,7 @@ from .const import (
     CONF_ENTRY_TYPE,
     CONF_ENTRY_TYPE_RF_DEVICE,
     CONF_ENTRY_TYPE_TRANSCEIVER,
+    CONF_FAST_STARTUP,
     CONF_IO_ANALOG_,
     CONF_IO_DHT11,
     CONF_IO_DHT22,
@@ -51,17 +55,46 @@ from .const import (
     CONF_IO_PWM_OUTPUT,
     CONF_IO_RF_RECEIVE,
     CONF_IO_RF_SEND,
+    CONF_RF_AVAILABILITY,
+    CONF_RF_AVAILABILITY_ALL,
+    CONF_RF_AVAILABILITY_ANY,
+    CONF_RF_AVAILABILITY_TRANSCEIVER,
+    CONF_RF_CAPTURE_SIZE,
+    CONF_RF_DEDUP_WINDOW,
+    CONF_RF_DUTY_CYCLE,
+    CONF_RF_EVENTS,
+    CONF_RF_EVENTS_ALL,
+    CONF_RF_EVENTS_LIST,
+    CONF_RF_EVENTS_LISTED,
+    CONF_RF_EVENTS_UNCLAIMED,
+    CONF_RF_GROUP_COMMANDS,
     CONF_RF_ID,
     CONF_RF_ID_IGNORE_ALL,
+    CONF_RF_NOISE_ALLOWLIST,
+    CONF_RF_NOISE_FILTER,
     CONF_RF_PROTOCOL,
     CONF_RF_REPEATS,
+    CONF_RF_REPEATS_ADAPTIVE,
+    CONF_RF_TRANSCEIVER,
     CONF_RF_UNIT,
     CONF_SERIAL_PORT,
+    DEFAULT_RF_DEDUP_WINDOW,
+    DEFAULT_RF_DUTY_CYCLE,
     DOMAIN,
 )
+from .network import (
+    async_probe_network_port,
+    create_homeduino,
+    is_network_port,
+    normalize_network_port,
+)
+from .protocols import FAMILY_PLATFORMS, protocol_catalogue, protocol_family
 
 _LOGGER = logging.getLogger(__name__)
 
+# RF device identifier, protocol-id or protocol-id-unit
+_RF_IDENTIFIER = re.compile(r"[a-z]+[0-9]*-[0-9]+(-[0-9]+)?")
+
 _DIGITAL_IO = [
     CONF_IO_RF_SEND,
     CONF_IO_DIGITAL_INPUT,
@@ -81,6 +114,7 @@ class HomeduinoConfigFlow(ConfigFlow, domain=DOMAIN):
 
     _step_setup_serial_schema: vol.Schema
     _step_setup_rf_device_schema: vol.Schema
+    _discovered_rf_device: (str, dict[str, Any], dict[str, Any])
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -237,13 +271,24 @@ class HomeduinoConfigFlow(ConfigFlow, domain=DOMAIN):
         if serial_port is None:
             raise vol.error.RequiredFieldInvalid("No serial port configured")
 
-        serial_port = await self.hass.async_add_executor_job(
-            get_serial_by_id, serial_port
-        )
+        if is_network_port(serial_port):
+            try:
+                serial_port = normalize_network_port(serial_port)
+            except ValueError:
+                errors[CONF_SERIAL_PORT] = "invalid_network_port"
+            else:
+                # Test if the endpoint is reachable without blocking on the
+                # serial connection
+                if not await async_probe_network_port(serial_port):
+                    errors[CONF_SERIAL_PORT] = "unreachable_network_port"
+        else:
+            serial_port = await self.hass.async_add_executor_job(
+                get_serial_by_id, serial_port
+            )
 
-        # Test if the device exists
-        if not os.path.exists(serial_port):
-            errors[CONF_SERIAL_PORT] = "nonexisting_serial_port"
+            # Test if the device exists
+            if not os.path.exists(serial_port):
+                errors[CONF_SERIAL_PORT] = "nonexisting_serial_port"
 
         await self.async_set_unique_id(f"{DOMAIN}-{serial_port}")
         self._abort_if_unique_id_configured()
@@ -253,7 +298,7 @@ class HomeduinoConfigFlow(ConfigFlow, domain=DOMAIN):
         if errors.get(CONF_SERIAL_PORT) is None:
             # Test if we can connect to the device
             try:
-                homeduino = Homeduino(
+                homeduino = create_homeduino(
                     serial_port,
                     baud_rate,
                     None,
@@ -328,20 +373,11 @@ class HomeduinoConfigFlow(ConfigFlow, domain=DOMAIN):
             if not errors:
                 return self.async_create_entry(title=title, data=data, options=options)
 
-        protocol_names = Homeduino.get_protocols()
-        protocol_names = [
-            protocol_name
-            for protocol_name in protocol_names
-            if protocol_name.startswith(
-                ("contact", "dimmer", "pir", "switch", "weather")
-            )
-        ]
-
         self._step_setup_rf_device_schema = vol.Schema(
             {
                 vol.Required(CONF_RF_PROTOCOL, default=""): SelectSelector(
                     SelectSelectorConfig(
-                        options=protocol_names,
+                        options=list(protocol_catalogue().protocols),
                         mode=SelectSelectorMode.DROPDOWN,
                     )
                 ),
@@ -389,6 +425,18 @@ class HomeduinoConfigFlow(ConfigFlow, domain=DOMAIN):
             rf_unit = int(rf_unit)
         rf_id_ignore_all: bool = data.get(CONF_RF_ID_IGNORE_ALL, False)
 
+        return await self._async_rf_device_entry(
+            rf_protocol, rf_id, rf_unit, rf_id_ignore_all
+        )
+
+    async def _async_rf_device_entry(
+        self,
+        rf_protocol: str,
+        rf_id: int,
+        rf_unit: int | None,
+        rf_id_ignore_all: bool = False,
+    ) -> (str, dict[str, Any], dict[str, Any]):
+        """Set the unique ID and create the title, data and options of a RF device."""
         unique_id = f"{DOMAIN}-{rf_protocol}-{rf_id}"
         if rf_unit is not None:
             unique_id += f"-{rf_unit}"
@@ -408,7 +456,7 @@ class HomeduinoConfigFlow(ConfigFlow, domain=DOMAIN):
 
         options = {}
 
-        if rf_protocol.startswith("switch") or rf_protocol.startswith("dimmer"):
+        if protocol_family(rf_protocol) in ("switch", "dimmer"):
             options[CONF_RF_ID_IGNORE_ALL] = rf_id_ignore_all
 
         # Return title, data, options.
@@ -418,6 +466,34 @@ class HomeduinoConfigFlow(ConfigFlow, domain=DOMAIN):
             options,
         )
 
+    async def async_step_integration_discovery(
+        self, discovery_info: DiscoveryInfoType
+    ) -> ConfigFlowResult:
+        """Handle a RF device discovered by a transceiver."""
+        self._discovered_rf_device = await self._async_rf_device_entry(
+            discovery_info[CONF_RF_PROTOCOL],
+            discovery_info[CONF_RF_ID],
+            discovery_info.get(CONF_RF_UNIT),
+        )
+        self.context["title_placeholders"] = {"name": self._discovered_rf_device[0]}
+
+        return await self.async_step_discovery_confirm()
+
+    async def async_step_discovery_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Confirm the setup of a discovered RF device."""
+        title, data, options = self._discovered_rf_device
+
+        if user_input is not None:
+            return self.async_create_entry(title=title, data=data, options=options)
+
+        self._set_confirm_only()
+        return self.async_show_form(
+            step_id="discovery_confirm",
+            description_placeholders={"name": title},
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(
@@ -428,13 +504,83 @@ class HomeduinoConfigFlow(ConfigFlow, domain=DOMAIN):
 
 
 class HomeduinoOptionsFlowHandler(OptionsFlow):
-    TRANSCEIVER_OPTIONS_SCHEMA = vol.Schema({})
+    TRANSCEIVER_OPTIONS_SCHEMA = vol.Schema(
+        {
+            vol.Optional(CONF_FAST_STARTUP): BooleanSelector(),
+            vol.Optional(
+                CONF_RF_DEDUP_WINDOW, default=DEFAULT_RF_DEDUP_WINDOW
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0,
+                    step=1,
+                    unit_of_measurement="ms",
+                    mode=NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_RF_DUTY_CYCLE, default=DEFAULT_RF_DUTY_CYCLE
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=1,
+                    max=100,
+                    step=1,
+                    unit_of_measurement="%",
+                    mode=NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(CONF_RF_NOISE_FILTER, default=[]): SelectSelector(
+                SelectSelectorConfig(
+                    options=list(FAMILY_PLATFORMS),
+                    multiple=True,
+                    translation_key="rf_noise_filter",
+                )
+            ),
+            vol.Optional(CONF_RF_NOISE_ALLOWLIST, default=[]): SelectSelector(
+                SelectSelectorConfig(options=[], multiple=True, custom_value=True)
+            ),
+            vol.Optional(CONF_RF_EVENTS, default=CONF_RF_EVENTS_ALL): SelectSelector(
+                SelectSelectorConfig(
+                    options=[
+                        CONF_RF_EVENTS_ALL,
+                        CONF_RF_EVENTS_UNCLAIMED,
+                        CONF_RF_EVENTS_LISTED,
+                    ],
+                    translation_key="rf_events",
+                )
+            ),
+            vol.Optional(CONF_RF_EVENTS_LIST, default=[]): SelectSelector(
+                SelectSelectorConfig(options=[], multiple=True, custom_value=True)
+            ),
+            vol.Optional(CONF_RF_CAPTURE_SIZE, default=0): NumberSelector(
+                NumberSelectorConfig(
+                    min=0, max=1000, step=1, mode=NumberSelectorMode.BOX
+                )
+            ),
+        }
+    )
     RF_DEVICE_OPTIONS_SCHEMA = vol.Schema(
         {
             vol.Optional(CONF_RF_ID_IGNORE_ALL): BooleanSelector(),
+            vol.Optional(CONF_RF_GROUP_COMMANDS): BooleanSelector(),
             vol.Optional(CONF_RF_REPEATS, default=DEFAULT_REPEATS): NumberSelector(
                 NumberSelectorConfig(min=1, step=1, mode=NumberSelectorMode.BOX)
             ),
+            vol.Optional(CONF_RF_REPEATS_ADAPTIVE): BooleanSelector(),
+            vol.Optional(CONF_RF_TRANSCEIVER): DeviceSelector(
+                DeviceSelectorConfig(integration=DOMAIN, model="transceiver")
+            ),
+            vol.Optional(
+                CONF_RF_AVAILABILITY, default=CONF_RF_AVAILABILITY_ANY
+            ): SelectSelector(
+                SelectSelectorConfig(
+                    options=[
+                        CONF_RF_AVAILABILITY_ANY,
+                        CONF_RF_AVAILABILITY_ALL,
+                        CONF_RF_AVAILABILITY_TRANSCEIVER,
+                    ],
+                    translation_key="rf_availability",
+                )
+            ),
         }
     )
 
@@ -513,12 +659,36 @@ class HomeduinoOptionsFlowHandler(OptionsFlow):
         if user_input is not None:
             data_schema(user_input)
 
+            if entry_type == CONF_ENTRY_TYPE_TRANSCEIVER:
+                user_input[CONF_RF_DEDUP_WINDOW] = int(
+                    user_input.get(CONF_RF_DEDUP_WINDOW, DEFAULT_RF_DEDUP_WINDOW)
+                )
+                user_input[CONF_RF_DUTY_CYCLE] = int(
+                    user_input.get(CONF_RF_DUTY_CYCLE, DEFAULT_RF_DUTY_CYCLE)
+                )
+                user_input[CONF_RF_CAPTURE_SIZE] = int(
+                    user_input.get(CONF_RF_CAPTURE_SIZE, 0)
+                )
+                for identifier in user_input.get(CONF_RF_NOISE_ALLOWLIST, []):
+                    if not _RF_IDENTIFIER.fullmatch(identifier):
+                        errors[CONF_RF_NOISE_ALLOWLIST] = "invalid_rf_identifier"
+                for identifier in user_input.get(CONF_RF_EVENTS_LIST, []):
+                    if not _RF_IDENTIFIER.fullmatch(identifier):
+                        errors[CONF_RF_EVENTS_LIST] = "invalid_rf_identifier"
+
             if entry_type == CONF_ENTRY_TYPE_RF_DEVICE:
                 user_input[CONF_RF_REPEATS] = int(
                     user_input.get(CONF_RF_REPEATS, DEFAULT_REPEATS)
                 )
+                if user_input.get(
+                    CONF_RF_AVAILABILITY
+                ) == CONF_RF_AVAILABILITY_TRANSCEIVER and not user_input.get(
+                    CONF_RF_TRANSCEIVER
+                ):
+                    errors[CONF_RF_AVAILABILITY] = "rf_transceiver_required"
 
-            return self.async_create_entry(title="", data=user_input)
+            if not errors:
+                return self.async_create_entry(title="", data=user_input)
 
         if user_input is not None:
             data_schema = self.add_suggested_values_to_schema(data_schema, user_input)
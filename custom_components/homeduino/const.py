@@ -12,6 +12,7 @@ CONF_SERIAL_PORT: Final = "serial_port"
 CONF_BAUD_RATE: Final = "baud_rate"
 CONF_RECEIVE_PIN: Final = "receive_pin"
 CONF_SEND_PIN: Final = "send_pin"
+CONF_FAST_STARTUP: Final = "fast_startup"
 
 CONF_IO_DIGITAL_ = "digital_"
 CONF_IO_ANALOG_ = "analog_"
@@ -29,4 +30,34 @@ CONF_RF_PROTOCOL: Final = "rf_protocol"
 CONF_RF_ID: Final = "rf_id"
 CONF_RF_UNIT: Final = "rf_unit"
 CONF_RF_ID_IGNORE_ALL: Final = "rf_id_ignore_all"
+CONF_RF_GROUP_COMMANDS: Final = "rf_group_commands"
 CONF_RF_REPEATS: Final = "rf_repeats"
+CONF_RF_REPEATS_ADAPTIVE: Final = "rf_repeats_adaptive"
+CONF_RF_TRANSCEIVER: Final = "rf_transceiver"
+CONF_RF_AVAILABILITY: Final = "rf_availability"
+CONF_RF_AVAILABILITY_ANY: Final = "any"
+CONF_RF_AVAILABILITY_ALL: Final = "all"
+CONF_RF_AVAILABILITY_TRANSCEIVER: Final = "transceiver"
+
+CONF_RF_DEDUP_WINDOW: Final = "rf_dedup_window"
+DEFAULT_RF_DEDUP_WINDOW: Final = 500
+
+CONF_RF_DUTY_CYCLE: Final = "rf_duty_cycle"
+DEFAULT_RF_DUTY_CYCLE: Final = 50
+
+CONF_RF_NOISE_FILTER: Final = "rf_noise_filter"
+CONF_RF_NOISE_ALLOWLIST: Final = "rf_noise_allowlist"
+
+CONF_RF_CAPTURE_SIZE: Final = "rf_capture_size"
+
+CONF_RF_EVENTS: Final = "rf_events"
+CONF_RF_EVENTS_ALL: Final = "all"
+CONF_RF_EVENTS_UNCLAIMED: Final = "unclaimed"
+CONF_RF_EVENTS_LISTED: Final = "listed"
+CONF_RF_EVENTS_LIST: Final = "rf_events_list"
+
+# Minimal de-duplication windows in seconds for protocol families which repeat
+# their frames over a longer period
+RF_DEDUP_WINDOWS: Final = {
+    "weather": 2.0,
+}
@@ -0,0 +1,135 @@
+"""Device triggers for Homeduino RF devices."""
+
+from collections.abc import Callable
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
+from homeassistant.const import CONF_DEVICE_ID, CONF_DOMAIN, CONF_PLATFORM, CONF_TYPE
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+from homeassistant.helpers.typing import ConfigType
+
+from . import HomeduinoCoordinator
+from .const import (
+    CONF_ENTRY_TYPE,
+    CONF_ENTRY_TYPE_RF_DEVICE,
+    CONF_RF_ID,
+    CONF_RF_PROTOCOL,
+    CONF_RF_UNIT,
+    DOMAIN,
+)
+from .protocols import LOW_BATTERY_PROTOCOLS, protocol_family
+
+# Test if the values of a received RF packet match the trigger type
+TRIGGER_TYPES: dict[str, Callable[[dict], bool]] = {
+    "pressed": lambda values: True,
+    "turned_on": lambda values: values.get("state") is True,
+    "turned_off": lambda values: values.get("state") is False,
+    # Contacts report True when closed
+    "opened": lambda values: values.get("state") is False,
+    "closed": lambda values: values.get("state") is True,
+    "motion": lambda values: values.get("state") is True,
+    "low_battery": lambda values: values.get("lowBattery") is True,
+}
+
+# Trigger types per protocol family
+FAMILY_TRIGGER_TYPES: dict[str, tuple[str, ...]] = {
+    "contact": ("opened", "closed"),
+    "dimmer": ("pressed", "turned_on", "turned_off"),
+    "pir": ("motion",),
+    "switch": ("pressed", "turned_on", "turned_off"),
+}
+
+TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
+    {
+        vol.Required(CONF_TYPE): vol.In(TRIGGER_TYPES),
+    }
+)
+
+
+def _rf_device_key(hass: HomeAssistant, device_id: str) -> tuple | None:
+    """Return the (protocol, id, unit) of the RF device with the device id."""
+    device = dr.async_get(hass).async_get(device_id)
+    if device is None:
+        return None
+
+    for entry_id in device.config_entries:
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if (
+            entry is None
+            or entry.domain != DOMAIN
+            or entry.data.get(CONF_ENTRY_TYPE) != CONF_ENTRY_TYPE_RF_DEVICE
+        ):
+            continue
+
+        unit = entry.data.get(CONF_RF_UNIT)
+        return (
+            entry.data[CONF_RF_PROTOCOL],
+            int(entry.data[CONF_RF_ID]),
+            int(unit) if unit is not None else None,
+        )
+
+    return None
+
+
+async def async_get_triggers(
+    hass: HomeAssistant, device_id: str
+) -> list[dict[str, Any]]:
+    """List device triggers for a Homeduino RF device."""
+    if (key := _rf_device_key(hass, device_id)) is None:
+        return []
+
+    protocol = key[0]
+    trigger_types = FAMILY_TRIGGER_TYPES.get(protocol_family(protocol), ())
+    if protocol in LOW_BATTERY_PROTOCOLS:
+        trigger_types += ("low_battery",)
+
+    return [
+        {
+            CONF_PLATFORM: "device",
+            CONF_DOMAIN: DOMAIN,
+            CONF_DEVICE_ID: device_id,
+            CONF_TYPE: trigger_type,
+        }
+        for trigger_type in trigger_types
+    ]
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Attach a trigger to the RF packets of a Homeduino RF device."""
+    if (key := _rf_device_key(hass, config[CONF_DEVICE_ID])) is None:
+        raise vol.Invalid(f"Device {config[CONF_DEVICE_ID]} is not a RF device")
+
+    trigger_data = trigger_info["trigger_data"]
+    trigger_type = config[CONF_TYPE]
+    matches = TRIGGER_TYPES[trigger_type]
+    job = HassJob(action, f"homeduino device trigger {trigger_info}")
+
+    @callback
+    def rf_device_trigger(decoded) -> None:
+        values = decoded["values"]
+        if not matches(values):
+            return
+
+        hass.async_run_hass_job(
+            job,
+            {
+                "trigger": {
+                    **trigger_data,
+                    **config,
+                    "values": values,
+                    "description": f"Homeduino {trigger_type}",
+                }
+            },
+        )
+
+    return HomeduinoCoordinator.instance(hass).async_add_rf_device_trigger(
+        rf_device_trigger, *key
+    )
@@ -98,7 +98,13 @@ class HomeduinoRFEvent(CoordinatorEntity, EventEntity):
         # my_device_api.listen(self._async_handle_event)
         await super().async_added_to_hass()
 
-        if self.coordinator.connected():
+        self.async_on_remove(
+            self.coordinator.async_add_rf_listener(
+                self._handle_rf_receive, self.protocol, self.id, self.unit
+            )
+        )
+
+        if self.coordinator.rf_available(self.protocol, self.id, self.unit):
             self._attr_available = True
 
         self.async_write_ha_state()
@@ -106,26 +112,18 @@ class HomeduinoRFEvent(CoordinatorEntity, EventEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if not self.coordinator.connected():
-            self._attr_available = False
-        else:
-            self._attr_available = True
-            self.async_write_ha_state()
-
-            if not self.coordinator.data:
-                return
-
-            if self.coordinator.data.get("protocol") != self.protocol:
-                return
+        available = self.coordinator.rf_available(self.protocol, self.id, self.unit)
+        if available == self._attr_available:
+            self.coordinator.suppressed_state_writes += 1
+            return
 
-            if self.coordinator.data.get("values", {}).get("id") != self.id:
-                return
-
-            if self.coordinator.data.get("values", {}).get("unit") != self.unit:
-                return
-
-            _LOGGER.debug(self.coordinator.data)
+        self._attr_available = available
+        self.async_write_ha_state()
 
-            self._trigger_event("single_press")
+    @callback
+    def _handle_rf_receive(self, decoded) -> None:
+        """Handle a RF packet addressed to this event."""
+        _LOGGER.debug(decoded)
 
+        self._trigger_event("single_press")
         self.async_write_ha_state()
@@ -26,9 +26,11 @@ from .const import (
     CONF_RF_ID_IGNORE_ALL,
     CONF_RF_PROTOCOL,
     CONF_RF_REPEATS,
+    CONF_RF_REPEATS_ADAPTIVE,
     CONF_RF_UNIT,
     DOMAIN,
 )
+from .transmit import rf_priority
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -60,6 +62,7 @@ async def async_setup_entry(
             unit = int(unit)
         id_ignore_all = config_entry.options.get(CONF_RF_ID_IGNORE_ALL)
         repeats = config_entry.options.get(CONF_RF_REPEATS, DEFAULT_REPEATS)
+        adaptive_repeats = config_entry.options.get(CONF_RF_REPEATS_ADAPTIVE, False)
 
         identifier = f"{protocol}-{id}"
         if unit is not None:
@@ -85,7 +88,12 @@ async def async_setup_entry(
 
         entities.append(
             HomeduinoRFDimmer(
-                coordinator, device_info, entity_description, id_ignore_all, repeats
+                coordinator,
+                device_info,
+                entity_description,
+                id_ignore_all,
+                repeats,
+                adaptive_repeats,
             )
         )
 
@@ -116,6 +124,7 @@ class HomeduinoRFDimmer(CoordinatorEntity, LightEntity, RestoreEntity):
         entity_description: HomeduinoRFLightEntityDescription,
         ignore_all: bool = False,
         repeats: int = DEFAULT_REPEATS,
+        adaptive_repeats: bool = False,
     ) -> None:
         """Initialize the switch."""
         super().__init__(coordinator, entity_description.key)
@@ -127,6 +136,7 @@ class HomeduinoRFDimmer(CoordinatorEntity, LightEntity, RestoreEntity):
         self.entity_description = entity_description
         self.ignore_all = ignore_all
         self.repeats = repeats
+        self.adaptive_repeats = adaptive_repeats
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -143,7 +153,22 @@ class HomeduinoRFDimmer(CoordinatorEntity, LightEntity, RestoreEntity):
             self._attr_brightness = last_state.attributes.get(ATTR_BRIGHTNESS, 255)
             self._off_brightness = last_state.attributes.get("off_brightness")
 
-        if self.coordinator.connected():
+        for protocol in self.entity_description.protocols:
+            self.async_on_remove(
+                self.coordinator.async_add_rf_listener(
+                    self._handle_rf_receive,
+                    protocol,
+                    self.entity_description.id,
+                    self.entity_description.unit,
+                    group=not self.ignore_all,
+                )
+            )
+
+        if self.coordinator.rf_available(
+            self.entity_description.protocols[0],
+            self.entity_description.id,
+            self.entity_description.unit,
+        ):
             self._attr_available = True
 
         self.async_write_ha_state()
@@ -159,49 +184,54 @@ class HomeduinoRFDimmer(CoordinatorEntity, LightEntity, RestoreEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if not self.coordinator.connected():
-            self._attr_available = False
-        else:
-            self._attr_available = True
-            self.async_write_ha_state()
+        available = self.coordinator.rf_available(
+            self.entity_description.protocols[0],
+            self.entity_description.id,
+            self.entity_description.unit,
+        )
+        if available == self._attr_available:
+            self.coordinator.suppressed_state_writes += 1
+            return
 
-            if not self.coordinator.data:
-                return
+        self._attr_available = available
+        self.async_write_ha_state()
 
-            if (
-                self.coordinator.data.get("protocol")
-                not in self.entity_description.protocols
-            ):
-                return
+    @callback
+    def _handle_rf_receive(self, decoded) -> None:
+        """Handle a RF packet addressed to this light."""
+        values = decoded["values"]
+        if values.get("all", False) is True and self.ignore_all:
+            return
 
-            if (
-                self.coordinator.data.get("values", {}).get("id")
-                != self.entity_description.id
-            ):
-                return
+        _LOGGER.debug(decoded)
 
-            if (
-                self.coordinator.data.get("values", {}).get("unit")
-                != self.entity_description.unit
-                and self.coordinator.data.get("values", {}).get("all", False) is False
-            ):
-                return
+        is_on = values.get("state")
+        brightness = self._attr_brightness
 
-            if (
-                self.coordinator.data.get("values", {}).get("all", False) is True
-                and self.ignore_all
-            ):
-                return
+        new_brightness = values.get("dimlevel")
+        if new_brightness:
+            brightness = new_brightness * 17
 
-            _LOGGER.debug(self.coordinator.data)
+        if is_on == self._attr_is_on and brightness == self._attr_brightness:
+            self.coordinator.suppressed_state_writes += 1
+            return
 
-            self._attr_is_on = self.coordinator.data.get("values", {}).get("state")
+        self._attr_is_on = is_on
+        self._attr_brightness = brightness
+        self.async_write_ha_state()
 
-            new_brightness = self.coordinator.data.get("values", {}).get("dimlevel")
-            if new_brightness:
-                self._attr_brightness = new_brightness * 17
+    @property
+    def rf_repeats(self) -> int:
+        """Return the number of repeats to send RF commands with."""
+        if not self.adaptive_repeats:
+            return self.repeats
 
-        self.async_write_ha_state()
+        return self.coordinator.rf_adaptive_repeats(
+            self.entity_description.protocols[0],
+            self.entity_description.id,
+            self.entity_description.unit,
+            self.repeats,
+        )
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the entity on."""
@@ -229,7 +259,8 @@ class HomeduinoRFDimmer(CoordinatorEntity, LightEntity, RestoreEntity):
                 "state": state,
                 "dimlevel": brightness,
             },
-            self.repeats,
+            self.rf_repeats,
+            rf_priority(self._context),
         ):
             self._attr_is_on = True
             self._attr_brightness = brightness * 17
@@ -249,7 +280,8 @@ class HomeduinoRFDimmer(CoordinatorEntity, LightEntity, RestoreEntity):
                 "state": False,
                 "dimlevel": 0,
             },
-            self.repeats,
+            self.rf_repeats,
+            rf_priority(self._context),
         ):
             self._attr_is_on = False
 
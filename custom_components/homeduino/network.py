@@ -0,0 +1,131 @@
+"""Network attached transceivers for the Homeduino 433 MHz RF transceiver integration."""
+
+import asyncio
+import logging
+from urllib.parse import urlsplit
+
+from homeduino import Homeduino
+
+from .transceiver import ConnectionTrackingHomeduino
+
+_LOGGER = logging.getLogger(__name__)
+
+# Serial port URL schemes of network attached transceivers, e.g. behind ser2net
+NETWORK_SCHEMES = ("socket", "rfc2217")
+
+NETWORK_PROBE_TIMEOUT = 5
+# Time to open the endpoint and for the Homeduino behind it to become ready
+NETWORK_CONNECT_TIMEOUT = 15
+
+
+def is_network_port(serial_port: str) -> bool:
+    """Test if the serial port is the URL of a network attached transceiver."""
+    return serial_port.partition("://")[0].lower() in NETWORK_SCHEMES
+
+
+def normalize_network_port(serial_port: str) -> str:
+    """Return the URL of a network attached transceiver in a canonical form.
+
+    Raises ValueError if the URL has no host or port.
+    """
+    url = urlsplit(serial_port.strip())
+    if url.hostname is None or url.port is None:
+        raise ValueError(f"No host and port in {serial_port}")
+
+    host = url.hostname
+    if ":" in host:
+        host = f"[{host}]"
+
+    normalized = f"{url.scheme.lower()}://{host}:{url.port}"
+    if url.query:
+        normalized += f"?{url.query}"
+
+    return normalized
+
+
+async def async_probe_network_port(
+    serial_port: str, timeout: float = NETWORK_PROBE_TIMEOUT
+) -> bool:
+    """Test if the endpoint of a network attached transceiver accepts connections."""
+    url = urlsplit(serial_port)
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(url.hostname, url.port), timeout
+        )
+    except (OSError, asyncio.TimeoutError) as ex:
+        _LOGGER.debug("Unable to reach %s: %s", serial_port, ex)
+        return False
+
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+
+    return True
+
+
+class _NoSuchFileFilter(logging.Filter):
+    """Drop the warning of the homeduino library that a serial port is no file."""
+
+    def __init__(self, serial_port: str) -> None:
+        super().__init__()
+        self._message = f"No such file or directory: '{serial_port}'"
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.getMessage() != self._message
+
+
+class NetworkHomeduino(ConnectionTrackingHomeduino):
+    """Homeduino attached over the network.
+
+    A network connect is bounded by a timeout, also when the library reconnects,
+    so an unreachable endpoint does not stall the transceiver for minutes.
+    """
+
+    def __init__(
+        self,
+        serial_port: str,
+        baud_rate: int,
+        rf_receive_pin: int | None,
+        rf_send_pin: int | None,
+    ) -> None:
+        # Homeduino.__init__ warns if the serial port is not an existing file,
+        # which a URL never is
+        logger = logging.getLogger(Homeduino.__module__)
+        no_such_file = _NoSuchFileFilter(serial_port)
+        logger.addFilter(no_such_file)
+        try:
+            super().__init__(serial_port, baud_rate, rf_receive_pin, rf_send_pin)
+        finally:
+            logger.removeFilter(no_such_file)
+
+    async def _connect(self) -> bool:
+        try:
+            async with asyncio.timeout(NETWORK_CONNECT_TIMEOUT):
+                return await super()._connect()
+        except TimeoutError:
+            _LOGGER.error("Timeout while connecting to %s", self.serial_port)
+        except OSError as ex:
+            # The library only handles serial errors, not e.g. a refused connection.
+            # It retries every 0.1 seconds, so only log at debug level
+            _LOGGER.debug("Unable to connect to %s: %s", self.serial_port, ex)
+
+        # Close a connection which was opened but did not become ready in time
+        await self._disconnect()
+        return False
+
+
+def create_homeduino(
+    serial_port: str,
+    baud_rate: int,
+    rf_receive_pin: int | None,
+    rf_send_pin: int | None,
+) -> ConnectionTrackingHomeduino:
+    """Return a Homeduino for a serial port or a network attached transceiver."""
+    if is_network_port(serial_port):
+        return NetworkHomeduino(serial_port, baud_rate, rf_receive_pin, rf_send_pin)
+
+    return ConnectionTrackingHomeduino(
+        serial_port, baud_rate, rf_receive_pin, rf_send_pin
+    )
@@ -10,7 +10,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeduino import Homeduino, HomeduinoPinMode
+from homeduino import Homeduino
 
 from . import HomeduinoCoordinator
 from .const import (
@@ -100,25 +100,41 @@ class HomeduinoTransceiverNumber(CoordinatorEntity, RestoreNumber):
 
         self._homeduino = self.coordinator.get_transceiver(self.device_entry.id)
 
-        if self._homeduino.connected():
-            self._attr_available = True
-
-            await self._homeduino.pin_mode(
-                self.entity_description.digital_io, HomeduinoPinMode.OUTPUT
+        self.async_on_remove(
+            await self.coordinator.async_add_startup_job(
+                self.device_entry.id, self._async_setup_io, replay=True
             )
+        )
+
+        self.async_write_ha_state()
+
+    async def _async_setup_io(self, homeduino: Homeduino) -> None:
+        """Restore the value of the PWM output.
 
+        After a reconnect the current value is restored instead of the last value.
+        """
+        native_value = self._attr_native_value
+        if native_value is None:
             last_number_data = await self.async_get_last_number_data()
-            if (last_number_data is not None) and (
-                last_number_data.native_value is not None
-            ):
+            if last_number_data is not None:
                 native_value = last_number_data.native_value
-                if await self._homeduino.analog_write(
-                    self.entity_description.digital_io, int(native_value)
-                ):
-                    self._attr_native_value = native_value
 
+        if native_value is not None and await homeduino.analog_write(
+            self.entity_description.digital_io, int(native_value)
+        ):
+            self._attr_native_value = native_value
+
+        self._attr_available = True
         self.async_write_ha_state()
 
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        if not self._attr_available:
+            return self._attr_available
+
+        return self.coordinator.connected(self.device_entry.id)
+
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         if await self._homeduino.analog_write(
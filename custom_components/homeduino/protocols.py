@@ -0,0 +1,87 @@
+"""RF protocol catalogue for the Homeduino 433 MHz RF transceiver integration."""
+
+from dataclasses import dataclass
+from functools import cache
+
+from homeassistant.const import Platform
+from homeduino import Homeduino
+
+# Protocol families which can be set up as RF device and the platforms they produce
+FAMILY_PLATFORMS: dict[str, tuple[Platform, ...]] = {
+    "contact": (Platform.BINARY_SENSOR,),
+    "dimmer": (Platform.LIGHT,),
+    "pir": (Platform.BINARY_SENSOR,),
+    "switch": (Platform.SWITCH,),
+    "weather": (Platform.SENSOR,),
+}
+
+# Sensor fields reported per protocol
+SENSOR_FIELDS: dict[str, tuple[str, ...]] = {
+    "weather4": ("temperature", "humidity"),
+    "weather5": (
+        "temperature",
+        "humidity",
+        "avgAirspeed",
+        "windGust",
+        "windDirection",
+        "rain",
+    ),
+    "weather7": ("temperature", "humidity"),
+    "weather13": ("temperature", "humidity"),
+    "weather19": ("temperature",),
+}
+
+# Protocols which report a low battery
+LOW_BATTERY_PROTOCOLS = frozenset(
+    ("contact4", "weather4", "weather5", "weather7", "weather13")
+)
+
+
+def protocol_family(protocol: str) -> str:
+    """Return the family of a protocol, e.g. switch for switch1."""
+    return protocol.rstrip("0123456789")
+
+
+@dataclass(frozen=True)
+class ProtocolCatalogue:
+    """The supported RF protocols indexed by family and by platform."""
+
+    protocols: tuple[str, ...]
+    families: dict[str, tuple[str, ...]]
+    platforms: dict[Platform, tuple[str, ...]]
+
+    def protocol_platforms(self, protocol: str) -> tuple[Platform, ...]:
+        """Return the platforms the protocol produces entities for."""
+        return tuple(
+            platform
+            for platform, protocols in self.platforms.items()
+            if protocol in protocols
+        )
+
+
+@cache
+def protocol_catalogue() -> ProtocolCatalogue:
+    """Return the protocol catalogue, built once on first use."""
+    protocols = tuple(
+        protocol
+        for protocol in Homeduino.get_protocols()
+        if protocol_family(protocol) in FAMILY_PLATFORMS
+    )
+
+    families: dict[str, list[str]] = {}
+    platforms: dict[Platform, list[str]] = {}
+    for protocol in protocols:
+        family = protocol_family(protocol)
+        families.setdefault(family, []).append(protocol)
+
+        protocol_platforms = FAMILY_PLATFORMS[family]
+        if protocol in LOW_BATTERY_PROTOCOLS:
+            protocol_platforms += (Platform.BINARY_SENSOR,)
+        for platform in dict.fromkeys(protocol_platforms):
+            platforms.setdefault(platform, []).append(protocol)
+
+    return ProtocolCatalogue(
+        protocols,
+        {family: tuple(x) for family, x in families.items()},
+        {platform: tuple(x) for platform, x in platforms.items()},
+    )
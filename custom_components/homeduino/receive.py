@@ -0,0 +1,331 @@
+"""RF receive helpers for the Homeduino 433 MHz RF transceiver integration."""
+
+import json
+import logging
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from .protocols import protocol_family
+
+RF_DIVERSITY_WINDOW = 0.3
+
+RF_DISCOVERY_HITS = 3
+RF_DISCOVERY_WINDOW = 300
+RF_DISCOVERY_INTERVAL = 60
+RF_DISCOVERY_REPEAT_WINDOW = 1
+
+RF_LOG_INTERVAL = 10
+
+
+class RFDeduplicator:
+    """Collapse identical decoded RF packets received within a time window.
+
+    RF devices send the same frame several times and the Homeduino decodes every
+    copy. Recently seen packets are kept in a bounded, time ordered dictionary so
+    expired packets can be evicted from the front.
+
+    Copies of a packet heard by other transceivers are merged into the same
+    reception, even if de-duplication is disabled, and the transceivers which
+    heard the reception are reported to on_reception.
+    """
+
+    def __init__(
+        self,
+        family_windows: dict[str, float],
+        max_size: int = 256,
+        on_reception: Callable[[str, dict, str], None] | None = None,
+    ) -> None:
+        self._family_windows = family_windows
+        self._max_size = max_size
+        self._on_reception = on_reception
+        self._horizon = RF_DIVERSITY_WINDOW
+        # Last seen time and the transceivers which heard it per packet
+        self._seen: OrderedDict[tuple, tuple[float, set]] = OrderedDict()
+
+        # Number of dropped duplicates and merged copies of other transceivers
+        # per protocol
+        self.duplicates: dict[str, int] = {}
+        self.merged: dict[str, int] = {}
+
+    def is_duplicate(
+        self, protocol: str, values: dict, window: float, source: str | None = None
+    ) -> bool:
+        """Test if the packet was already seen within the window in seconds.
+
+        The window is extended to the minimal window of the protocol family, a
+        window of 0 disables the de-duplication.
+        """
+        if window > 0:
+            window = max(window, self._family_windows.get(protocol_family(protocol), 0))
+            self._horizon = max(self._horizon, window)
+
+        now = time.monotonic()
+        seen = self._seen
+        while seen:
+            key, (last_seen, _) = next(iter(seen.items()))
+            if now - last_seen <= self._horizon and len(seen) < self._max_size:
+                break
+            del seen[key]
+
+        key = (protocol, tuple(values.items()))
+        last_seen, sources = seen.pop(key, (None, set()))
+        if last_seen is not None and now - last_seen > max(window, RF_DIVERSITY_WINDOW):
+            last_seen, sources = None, set()
+
+        # A burst of repeats keeps refreshing the packet, so the whole burst is
+        # collapsed even if it lasts longer than the window
+        seen[key] = (now, sources)
+
+        if source not in sources:
+            sources.add(source)
+            if self._on_reception is not None and source is not None:
+                self._on_reception(protocol, values, source)
+
+            if last_seen is not None:
+                self.merged[protocol] = self.merged.get(protocol, 0) + 1
+                return True
+        elif window <= 0:
+            # Without de-duplication every copy of the same transceiver is a
+            # new reception
+            seen[key] = (now, {source})
+        elif last_seen is not None and now - last_seen <= window:
+            self.duplicates[protocol] = self.duplicates.get(protocol, 0) + 1
+            return True
+
+        return False
+
+
+class RFReceptionHistory:
+    """Count per RF device how many receptions each transceiver heard.
+
+    The number of RF devices is bounded, the least recently heard device is
+    evicted first.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self._max_size = max_size
+        self._devices: OrderedDict[tuple, dict[str, int]] = OrderedDict()
+
+    def add(self, key: tuple, source: str) -> None:
+        """Add a reception of the RF device by a transceiver."""
+        counts = self._devices.pop(key, {})
+        counts[source] = counts.get(source, 0) + 1
+        self._devices[key] = counts
+        if len(self._devices) > self._max_size:
+            self._devices.popitem(last=False)
+
+    def get(self, key: tuple) -> dict[str, int]:
+        """Return the number of receptions per transceiver of the RF device."""
+        return self._devices.get(key, {})
+
+    def as_dict(self) -> dict[tuple, dict[str, int]]:
+        """Return the reception history."""
+        return dict(self._devices)
+
+
+@dataclass
+class RFCandidate:
+    """A decoded RF device which is not configured."""
+
+    first_seen: float
+    last_seen: float
+    hits: int = 0
+    discovered: bool = False
+
+
+class RFCandidateTable:
+    """Track the decoded RF devices which are not configured.
+
+    A candidate is discovered when it is heard a number of times within a time
+    window. Copies heard within the repeat window count as one hit, so the
+    repeats of a single transmission do not discover a device. The table is
+    bounded, the least recently heard candidate is evicted first, and
+    discoveries are rate limited so a noisy neighbour can not flood the
+    discovery queue.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 128,
+        hits: int = RF_DISCOVERY_HITS,
+        window: float = RF_DISCOVERY_WINDOW,
+        interval: float = RF_DISCOVERY_INTERVAL,
+        repeat_window: float = RF_DISCOVERY_REPEAT_WINDOW,
+    ) -> None:
+        self._max_size = max_size
+        self._hits = hits
+        self._window = window
+        self._interval = interval
+        self._repeat_window = repeat_window
+        self._last_discovery: float | None = None
+        self._candidates: OrderedDict[tuple, RFCandidate] = OrderedDict()
+
+        # Number of discoveries and of discoveries postponed by the rate limit
+        self.discoveries = 0
+        self.rate_limited = 0
+
+    def hit(self, key: tuple) -> bool:
+        """Count a reception of the candidate, returns True to discover it."""
+        now = time.monotonic()
+        candidate = self._candidates.pop(key, None)
+        if candidate is None or (
+            not candidate.discovered and now - candidate.first_seen > self._window
+        ):
+            candidate = RFCandidate(now, now)
+        elif now - candidate.last_seen < self._repeat_window:
+            # Repeat of the last transmission
+            candidate.last_seen = now
+            self._candidates[key] = candidate
+            return False
+
+        candidate.hits += 1
+        candidate.last_seen = now
+        self._candidates[key] = candidate
+        if len(self._candidates) > self._max_size:
+            self._candidates.popitem(last=False)
+
+        if candidate.discovered or candidate.hits < self._hits:
+            return False
+
+        if (
+            self._last_discovery is not None
+            and now - self._last_discovery < self._interval
+        ):
+            self.rate_limited += 1
+            return False
+
+        self._last_discovery = now
+        candidate.discovered = True
+        self.discoveries += 1
+        return True
+
+    def is_discovered(self, key: tuple) -> bool:
+        """Test if the candidate was discovered."""
+        candidate = self._candidates.get(key)
+        return candidate is not None and candidate.discovered
+
+    def discard(self, key: tuple) -> None:
+        """Remove a candidate, e.g. when it got configured."""
+        self._candidates.pop(key, None)
+
+    def as_dict(self) -> dict[tuple, RFCandidate]:
+        """Return the candidates."""
+        return dict(self._candidates)
+
+
+class _JSONValues:
+    """Format the values of a RF packet as JSON only when logged."""
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: dict) -> None:
+        self.values = values
+
+    def __str__(self) -> str:
+        return json.dumps(self.values)
+
+
+class RFReceiveLog:
+    """Log received RF packets, rate limited per (protocol, id).
+
+    Packets can also be captured per transceiver in a ring buffer of (time,
+    protocol, values) records, which are only formatted when read.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        interval: float = RF_LOG_INTERVAL,
+        max_size: int = 256,
+    ) -> None:
+        self._logger = logger
+        self._interval = interval
+        self._max_size = max_size
+        self._last_logged: OrderedDict[tuple, float] = OrderedDict()
+        self._captures: dict[str, deque[tuple[float, str, dict]]] = {}
+
+        # Number of packets not logged because of the rate limit
+        self.suppressed = 0
+
+    def set_capture_size(self, device_id: str, size: int) -> None:
+        """Set the number of packets to capture for a transceiver, 0 disables."""
+        if size > 0:
+            self._captures[device_id] = deque(
+                self._captures.get(device_id, ()), maxlen=size
+            )
+        else:
+            self._captures.pop(device_id, None)
+
+    def log(self, device_id: str, protocol: str, values: dict) -> None:
+        """Log and capture a received packet."""
+        if (captures := self._captures.get(device_id)) is not None:
+            captures.append((time.time(), protocol, values))
+
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
+
+        key = (protocol, values.get("id"))
+        now = time.monotonic()
+        last_logged = self._last_logged.pop(key, None)
+        if last_logged is not None and now - last_logged < self._interval:
+            self._last_logged[key] = last_logged
+            self.suppressed += 1
+            return
+
+        self._last_logged[key] = now
+        if len(self._last_logged) > self._max_size:
+            self._last_logged.popitem(last=False)
+
+        self._logger.info("RF Protocol: %s Values: %s", protocol, _JSONValues(values))
+
+    def captures(self, device_id: str) -> list[dict]:
+        """Return the captured packets of a transceiver, oldest first."""
+        return [
+            {"time": timestamp, "protocol": protocol, "values": dict(values)}
+            for timestamp, protocol, values in self._captures.get(device_id, ())
+        ]
+
+
+class RFReceiveStats:
+    """Measure the time spent handling the last received RF packets."""
+
+    def __init__(self, max_size: int = 1000) -> None:
+        # (monotonic time, duration) of the last handled packets
+        self._samples: deque[tuple[float, float]] = deque(maxlen=max_size)
+
+        # Number of packets received and handled, i.e. not dropped as duplicate or
+        # noise
+        self.received = 0
+        self.handled = 0
+
+    def add(self, duration: float, handled: bool) -> None:
+        """Record the time spent on a received packet."""
+        self.received += 1
+        if handled:
+            self.handled += 1
+        self._samples.append((time.monotonic(), duration))
+
+    def as_dict(self) -> dict:
+        """Return the packet rate and the latency percentiles in milliseconds."""
+        if not self._samples:
+            return {"received": self.received, "handled": self.handled}
+
+        durations = sorted(duration for _, duration in self._samples)
+        elapsed = self._samples[-1][0] - self._samples[0][0]
+
+        def percentile(p: int) -> float:
+            return round(durations[(len(durations) - 1) * p // 100] * 1000, 3)
+
+        return {
+            "received": self.received,
+            "handled": self.handled,
+            "packets_per_second": (
+                round((len(durations) - 1) / elapsed, 2) if elapsed > 0 else None
+            ),
+            "latency_p50": percentile(50),
+            "latency_p95": percentile(95),
+            "latency_p99": percentile(99),
+            "latency_max": percentile(100),
+        }
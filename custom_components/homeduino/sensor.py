@@ -11,6 +11,8 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     DEGREE,
     PERCENTAGE,
+    EntityCategory,
+    Platform,
     UnitOfPrecipitationDepth,
     UnitOfSpeed,
     UnitOfTemperature,
@@ -19,6 +21,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeduino import Homeduino
 
 from . import HomeduinoCoordinator
 from .const import (
@@ -30,12 +33,14 @@ from .const import (
     CONF_IO_DHT22,
     CONF_IO_DIGITAL_,
     CONF_IO_DIGITAL_INPUT,
+    CONF_IO_RF_SEND,
     CONF_RF_ID,
     CONF_RF_PROTOCOL,
     CONF_RF_UNIT,
     CONF_SERIAL_PORT,
     DOMAIN,
 )
+from .protocols import SENSOR_FIELDS, protocol_catalogue
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -59,6 +64,21 @@ async def async_setup_entry(
             name=config_entry.title,
         )
 
+        if CONF_IO_RF_SEND in config_entry.options.values():
+            entity_description = SensorEntityDescription(
+                key=config_entry.entry_id,
+                translation_key="rf_utilisation",
+                entity_category=EntityCategory.DIAGNOSTIC,
+                state_class=SensorStateClass.MEASUREMENT,
+                native_unit_of_measurement=PERCENTAGE,
+                suggested_display_precision=1,
+            )
+            entities.append(
+                HomeduinoTransceiverRFUtilisationSensor(
+                    coordinator, device_info, entity_description
+                )
+            )
+
         for analog_input in range(0, 8):
             key = CONF_IO_ANALOG_ + str(analog_input)
             value = config_entry.options.get(key, False)
@@ -106,7 +126,7 @@ async def async_setup_entry(
                 )
     elif entry_type == CONF_ENTRY_TYPE_RF_DEVICE and config_entry.data.get(
         CONF_RF_PROTOCOL
-    ).startswith("weather"):
+    ) in protocol_catalogue().platforms.get(Platform.SENSOR, ()):
         protocol = config_entry.data.get(CONF_RF_PROTOCOL)
         id = int(config_entry.data.get(CONF_RF_ID))
         unit = config_entry.data.get(CONF_RF_UNIT)
@@ -122,7 +142,9 @@ async def async_setup_entry(
             name=config_entry.title,
         )
 
-        if protocol in ("weather4", "weather5", "weather7", "weather13", "weather19"):
+        fields = SENSOR_FIELDS.get(protocol, ())
+
+        if "temperature" in fields:
             entity_description = HomeduinoRFSensorEntityDescription(
                 key=identifier,
                 device_class=SensorDeviceClass.TEMPERATURE,
@@ -138,7 +160,7 @@ async def async_setup_entry(
                 HomeduinoRFSensor(coordinator, device_info, entity_description)
             )
 
-        if protocol in ("weather4", "weather5", "weather7", "weather13"):
+        if "humidity" in fields:
             entity_description = HomeduinoRFSensorEntityDescription(
                 key=identifier,
                 device_class=SensorDeviceClass.HUMIDITY,
@@ -154,7 +176,7 @@ async def async_setup_entry(
                 HomeduinoRFSensor(coordinator, device_info, entity_description)
             )
 
-        if protocol in ("weather5",):
+        if "avgAirspeed" in fields:
             entity_description = HomeduinoRFSensorEntityDescription(
                 key=identifier,
                 device_class=SensorDeviceClass.WIND_SPEED,
@@ -170,7 +192,7 @@ async def async_setup_entry(
                 HomeduinoRFSensor(coordinator, device_info, entity_description)
             )
 
-        if protocol in ("weather5",):
+        if "windGust" in fields:
             entity_description = HomeduinoRFSensorEntityDescription(
                 key=identifier,
                 translation_key="wind_gust",
@@ -187,7 +209,7 @@ async def async_setup_entry(
                 HomeduinoRFSensor(coordinator, device_info, entity_description)
             )
 
-        if protocol in ("weather5",):
+        if "windDirection" in fields:
             entity_description = HomeduinoRFSensorEntityDescription(
                 key=identifier,
                 device_class=SensorDeviceClass.WIND_DIRECTION,
@@ -203,7 +225,7 @@ async def async_setup_entry(
                 HomeduinoRFSensor(coordinator, device_info, entity_description)
             )
 
-        if protocol in ("weather5",):
+        if "rain" in fields:
             entity_description = HomeduinoRFSensorEntityDescription(
                 key=identifier,
                 device_class=SensorDeviceClass.PRECIPITATION,
@@ -255,6 +277,14 @@ class HomeduinoTransceiverSensor(CoordinatorEntity, SensorEntity):
 
         self.entity_description = entity_description
 
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        if not self._attr_available:
+            return self._attr_available
+
+        return self.coordinator.connected(self.device_entry.id)
+
 
 class HomeduinoTransceiverAnalogSensor(HomeduinoTransceiverSensor):
     def __init__(
@@ -275,14 +305,21 @@ class HomeduinoTransceiverAnalogSensor(HomeduinoTransceiverSensor):
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
 
-        homeduino = self.coordinator.get_transceiver(self.device_entry.id)
+        self.async_on_remove(
+            await self.coordinator.async_add_startup_job(
+                self.device_entry.id, self._async_setup_io
+            )
+        )
+
+        self.async_write_ha_state()
+
+    async def _async_setup_io(self, homeduino: Homeduino) -> None:
+        """Subscribe to the analog input."""
         homeduino.add_analog_read_callback(
             self._analog_input, self._handle_analog_read_update
         )
 
-        if homeduino.connected():
-            self._attr_available = True
-
+        self._attr_available = True
         self.async_write_ha_state()
 
     @callback
@@ -309,14 +346,21 @@ class HomeduinoTransceiverDHTTemperatureSensor(HomeduinoTransceiverSensor):
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
 
-        homeduino = self.coordinator.get_transceiver(self.device_entry.id)
+        self.async_on_remove(
+            await self.coordinator.async_add_startup_job(
+                self.device_entry.id, self._async_setup_io
+            )
+        )
+
+        self.async_write_ha_state()
+
+    async def _async_setup_io(self, homeduino: Homeduino) -> None:
+        """Subscribe to the DHT sensor."""
         await homeduino.add_dht_read_callback(
             self._dht_type, self._digital_io, self._handle_dht_read_update
         )
 
-        if homeduino.connected():
-            self._attr_available = True
-
+        self._attr_available = True
         self.async_write_ha_state()
 
     @callback
@@ -343,14 +387,21 @@ class HomeduinoTransceiverDHTHumiditySensor(HomeduinoTransceiverSensor):
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
 
-        homeduino = self.coordinator.get_transceiver(self.device_entry.id)
+        self.async_on_remove(
+            await self.coordinator.async_add_startup_job(
+                self.device_entry.id, self._async_setup_io
+            )
+        )
+
+        self.async_write_ha_state()
+
+    async def _async_setup_io(self, homeduino: Homeduino) -> None:
+        """Subscribe to the DHT sensor."""
         await homeduino.add_dht_read_callback(
             self._dht_type, self._digital_io, self._handle_dht_read_update
         )
 
-        if homeduino.connected():
-            self._attr_available = True
-
+        self._attr_available = True
         self.async_write_ha_state()
 
     @callback
@@ -359,6 +410,31 @@ class HomeduinoTransceiverDHTHumiditySensor(HomeduinoTransceiverSensor):
         self.async_write_ha_state()
 
 
+class HomeduinoTransceiverRFUtilisationSensor(SensorEntity):
+    _attr_has_entity_name = True
+    _attr_should_poll = True
+
+    def __init__(
+        self,
+        coordinator: HomeduinoCoordinator,
+        device_info: DeviceInfo,
+        entity_description: SensorEntityDescription,
+    ):
+        """Initialize the sensor."""
+        self.coordinator = coordinator
+
+        self._attr_device_info = device_info
+
+        self._attr_unique_id = f"{entity_description.key}-rf_utilisation"
+
+        self.entity_description = entity_description
+
+    async def async_update(self) -> None:
+        """Update the airtime utilisation of the RF transmitter."""
+        utilisation = self.coordinator.rf_utilisation(self.device_entry.id)
+        self._attr_native_value = None if utilisation is None else utilisation * 100
+
+
 class HomeduinoRFSensor(CoordinatorEntity, SensorEntity):
     def __init__(
         self,
@@ -380,7 +456,20 @@ class HomeduinoRFSensor(CoordinatorEntity, SensorEntity):
 
         # ToDo
 
-        if self.coordinator.connected():
+        self.async_on_remove(
+            self.coordinator.async_add_rf_listener(
+                self._handle_rf_receive,
+                self.entity_description.protocol,
+                self.entity_description.id,
+                self.entity_description.unit,
+            )
+        )
+
+        if self.coordinator.rf_available(
+            self.entity_description.protocol,
+            self.entity_description.id,
+            self.entity_description.unit,
+        ):
             self._attr_available = True
 
         self.async_write_ha_state()
@@ -396,34 +485,41 @@ class HomeduinoRFSensor(CoordinatorEntity, SensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if not self.coordinator.connected():
-            self._attr_available = False
-        else:
-            self._attr_available = True
-            self.async_write_ha_state()
-
-            if not self.coordinator.data:
-                return
-
-            if (
-                self.coordinator.data.get("protocol")
-                != self.entity_description.protocol
-            ):
-                return
-
-            values = self.coordinator.data.get("values", {})
-            if values.get("id") != self.entity_description.id:
-                return
-
-            if values.get("unit") != self.entity_description.unit:
-                return
+        available = self.coordinator.rf_available(
+            self.entity_description.protocol,
+            self.entity_description.id,
+            self.entity_description.unit,
+        )
+        if available == self._attr_available:
+            self.coordinator.suppressed_state_writes += 1
+            return
 
-            _LOGGER.debug(self.coordinator.data)
-            try:
-                self._attr_native_value = values.get(self.entity_description.field)
-                self._attr_available = True
-            except ValueError as ex:
-                _LOGGER.error(ex)
-                self._attr_available = False
+        self._attr_available = available
+        self.async_write_ha_state()
 
+    @callback
+    def _handle_rf_receive(self, decoded) -> None:
+        """Handle a RF packet addressed to this sensor."""
+        _LOGGER.debug(decoded)
+        try:
+            native_value = decoded["values"].get(self.entity_description.field)
+            available = self.coordinator.rf_available(
+                self.entity_description.protocol,
+                self.entity_description.id,
+                self.entity_description.unit,
+            )
+        except ValueError as ex:
+            _LOGGER.error(ex)
+            native_value = self._attr_native_value
+            available = False
+
+        if (
+            native_value == self._attr_native_value
+            and available == self._attr_available
+        ):
+            self.coordinator.suppressed_state_writes += 1
+            return
+
+        self._attr_native_value = native_value
+        self._attr_available = available
         self.async_write_ha_state()
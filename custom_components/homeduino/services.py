@@ -0,0 +1,201 @@
+"""Services for the Homeduino 433 MHz RF transceiver integration."""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.helpers.selector import (
+    BooleanSelector,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
+from homeduino import DEFAULT_REPEATS
+
+from .const import DOMAIN
+from .protocols import protocol_catalogue
+from .transmit import rf_priority
+
+if TYPE_CHECKING:
+    from . import HomeduinoCoordinator
+
+CONF_SERVICE_DEVICE_ID = "device_id"
+CONF_SERVICE_COMMAND = "command"
+CONF_SERVICE_PROTOCOL = "protocol"
+CONF_SERVICE_ID = "id"
+CONF_SERVICE_UNIT = "unit"
+CONF_SERVICE_STATE = "state"
+CONF_SERVICE_ALL = "all"
+CONF_SERVICE_REPEATS = "repeats"
+CONF_SERVICE_COMMANDS = "commands"
+CONF_SERVICE_DIMLEVEL = "dimlevel"
+CONF_SERVICE_GROUP = "group"
+
+SERVICE_SEND_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SERVICE_DEVICE_ID): cv.string,
+        vol.Required(CONF_SERVICE_COMMAND): cv.string,
+    }
+)
+SERVICE_RAW_RF_SEND_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SERVICE_COMMAND): cv.string,
+        vol.Optional(CONF_SERVICE_REPEATS, default=DEFAULT_REPEATS): NumberSelector(
+            NumberSelectorConfig(min=1, mode=NumberSelectorMode.BOX)
+        ),
+    }
+)
+SERVICE_RF_SEND_BATCH_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SERVICE_COMMANDS): vol.All(
+            cv.ensure_list,
+            [
+                vol.Schema(
+                    {
+                        vol.Required(CONF_SERVICE_PROTOCOL): cv.string,
+                        vol.Required(CONF_SERVICE_ID): vol.Coerce(int),
+                        vol.Optional(CONF_SERVICE_UNIT): vol.Coerce(int),
+                        vol.Optional(CONF_SERVICE_STATE): cv.boolean,
+                        vol.Optional(CONF_SERVICE_DIMLEVEL): vol.All(
+                            vol.Coerce(int), vol.Range(min=0, max=15)
+                        ),
+                    }
+                )
+            ],
+        ),
+        vol.Optional(CONF_SERVICE_REPEATS, default=DEFAULT_REPEATS): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_SERVICE_GROUP, default=False): cv.boolean,
+    }
+)
+
+
+@cache
+def _service_rf_send_schema() -> vol.Schema:
+    """Return the rf_send schema, built once from the protocol catalogue."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_SERVICE_PROTOCOL, default=""): SelectSelector(
+                SelectSelectorConfig(
+                    options=list(protocol_catalogue().protocols),
+                    mode=SelectSelectorMode.DROPDOWN,
+                )
+            ),
+            vol.Required(CONF_SERVICE_ID): NumberSelector(
+                NumberSelectorConfig(min=0, mode=NumberSelectorMode.BOX)
+            ),
+            vol.Required(CONF_SERVICE_UNIT): NumberSelector(
+                NumberSelectorConfig(min=0, mode=NumberSelectorMode.BOX)
+            ),
+            vol.Required(CONF_SERVICE_STATE): cv.boolean,
+            vol.Optional(CONF_SERVICE_ALL): BooleanSelector(),
+            vol.Optional(CONF_SERVICE_REPEATS, default=DEFAULT_REPEATS): NumberSelector(
+                NumberSelectorConfig(min=1, mode=NumberSelectorMode.BOX)
+            ),
+        }
+    )
+
+
+@callback
+def async_setup_services(
+    hass: HomeAssistant, coordinator: HomeduinoCoordinator
+) -> None:
+    """Register the Homeduino services, once per Home Assistant instance."""
+
+    async def async_handle_send(call: ServiceCall):
+        """Handle the service call."""
+        device_id: str = call.data.get(CONF_SERVICE_DEVICE_ID)
+        command: str = call.data.get(CONF_SERVICE_COMMAND)
+
+        return await coordinator.send(device_id, command.strip())
+
+    async def async_handle_rf_send(call: ServiceCall) -> ServiceResponse:
+        """Handle the service call."""
+        protocol: str = call.data.get(CONF_SERVICE_PROTOCOL)
+        id_: int = int(call.data.get(CONF_SERVICE_ID))
+        unit: int = int(call.data.get(CONF_SERVICE_UNIT))
+        state: bool = bool(call.data.get(CONF_SERVICE_STATE))
+        all_: bool = bool(call.data.get(CONF_SERVICE_ALL))
+        repeats: int = int(call.data.get(CONF_SERVICE_REPEATS, DEFAULT_REPEATS))
+
+        results = await coordinator.rf_send_results(
+            protocol,
+            {"id": id_, "unit": unit, "state": state, "all": all_},
+            repeats,
+            rf_priority(call.context),
+        )
+
+        return {"transceivers": results}
+
+    async def async_handle_rf_send_batch(call: ServiceCall) -> ServiceResponse:
+        """Handle the service call."""
+        commands = [
+            (
+                command[CONF_SERVICE_PROTOCOL],
+                {
+                    key: value
+                    for key, value in command.items()
+                    if key != CONF_SERVICE_PROTOCOL
+                },
+            )
+            for command in call.data[CONF_SERVICE_COMMANDS]
+        ]
+        repeats: int = call.data[CONF_SERVICE_REPEATS]
+        group: bool = call.data[CONF_SERVICE_GROUP]
+
+        results = await coordinator.rf_send_batch(commands, repeats, group)
+
+        return {"transceivers": results}
+
+    async def async_handle_raw_rf_send(call: ServiceCall) -> ServiceResponse:
+        """Handle the service call."""
+        command: str = call.data.get(CONF_SERVICE_COMMAND)
+        repeats: int = int(call.data.get(CONF_SERVICE_REPEATS, DEFAULT_REPEATS))
+
+        results = await coordinator.raw_rf_send_results(
+            command, repeats, rf_priority(call.context)
+        )
+
+        return {"transceivers": results}
+
+    hass.services.async_register(
+        DOMAIN, "send", async_handle_send, schema=SERVICE_SEND_SCHEMA
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        "rf_send",
+        async_handle_rf_send,
+        schema=_service_rf_send_schema(),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        "rf_send_batch",
+        async_handle_rf_send_batch,
+        schema=SERVICE_RF_SEND_BATCH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        "raw_rf_send",
+        async_handle_raw_rf_send,
+        schema=SERVICE_RAW_RF_SEND_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
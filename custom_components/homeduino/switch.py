@@ -12,7 +12,7 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeduino import DEFAULT_REPEATS, Homeduino, HomeduinoPinMode
+from homeduino import DEFAULT_REPEATS, Homeduino
 
 from . import HomeduinoCoordinator
 from .const import (
@@ -25,10 +25,12 @@ from .const import (
     CONF_RF_ID_IGNORE_ALL,
     CONF_RF_PROTOCOL,
     CONF_RF_REPEATS,
+    CONF_RF_REPEATS_ADAPTIVE,
     CONF_RF_UNIT,
     CONF_SERIAL_PORT,
     DOMAIN,
 )
+from .transmit import rf_priority
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -76,6 +78,7 @@ async def async_setup_entry(
             unit = int(unit)
         id_ignore_all = config_entry.options.get(CONF_RF_ID_IGNORE_ALL)
         repeats = config_entry.options.get(CONF_RF_REPEATS, DEFAULT_REPEATS)
+        adaptive_repeats = config_entry.options.get(CONF_RF_REPEATS_ADAPTIVE, False)
 
         identifier = f"{protocol}-{id}"
         if unit is not None:
@@ -95,6 +98,7 @@ async def async_setup_entry(
             unit=unit,
             ignore_all=id_ignore_all,
             repeats=repeats,
+            adaptive_repeats=adaptive_repeats,
         )
         entities.append(HomeduinoRFSwitch(coordinator, device_info, entity_description))
 
@@ -115,6 +119,7 @@ class HomeduinoRFSwitchEntityDescription(
     unit: int | None = None
     ignore_all: bool = False
     repeats: int = DEFAULT_REPEATS
+    adaptive_repeats: bool = False
 
 
 class HomeduinoTransceiverSwitch(CoordinatorEntity, SwitchEntity, RestoreEntity):
@@ -150,18 +155,37 @@ class HomeduinoTransceiverSwitch(CoordinatorEntity, SwitchEntity, RestoreEntity)
 
         self._homeduino = self.coordinator.get_transceiver(self.device_entry.id)
 
-        if self._homeduino.connected():
-            self._attr_available = True
+        self.async_on_remove(
+            await self.coordinator.async_add_startup_job(
+                self.device_entry.id, self._async_setup_io, replay=True
+            )
+        )
+
+        self.async_write_ha_state()
 
-            await self._homeduino.pin_mode(self._digital_io, HomeduinoPinMode.OUTPUT)
+    async def _async_setup_io(self, homeduino: Homeduino) -> None:
+        """Restore the state of the digital output.
 
-            if (last_state := await self.async_get_last_state()) is not None:
-                is_on = last_state.state == STATE_ON
-                if await self._homeduino.digital_write(self._digital_io, is_on):
-                    self._attr_is_on = is_on
+        After a reconnect the current state is restored instead of the last state.
+        """
+        is_on = self._attr_is_on
+        if is_on is None and (last_state := await self.async_get_last_state()):
+            is_on = last_state.state == STATE_ON
 
+        if is_on is not None and await homeduino.digital_write(self._digital_io, is_on):
+            self._attr_is_on = is_on
+
+        self._attr_available = True
         self.async_write_ha_state()
 
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        if not self._attr_available:
+            return self._attr_available
+
+        return self.coordinator.connected(self.device_entry.id)
+
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the entity on."""
         _LOGGER.debug("Turning on %s", self.name)
@@ -208,7 +232,21 @@ class HomeduinoRFSwitch(CoordinatorEntity, SwitchEntity, RestoreEntity):
         if (last_state := await self.async_get_last_state()) is not None:
             self._attr_is_on = last_state.state == STATE_ON
 
-        if self.coordinator.connected():
+        self.async_on_remove(
+            self.coordinator.async_add_rf_listener(
+                self._handle_rf_receive,
+                self.entity_description.protocol,
+                self.entity_description.id,
+                self.entity_description.unit,
+                group=not self.entity_description.ignore_all,
+            )
+        )
+
+        if self.coordinator.rf_available(
+            self.entity_description.protocol,
+            self.entity_description.id,
+            self.entity_description.unit,
+        ):
             self._attr_available = True
 
         self.async_write_ha_state()
@@ -224,45 +262,47 @@ class HomeduinoRFSwitch(CoordinatorEntity, SwitchEntity, RestoreEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if not self.coordinator.connected():
-            self._attr_available = False
-        else:
-            self._attr_available = True
-            self.async_write_ha_state()
-
-            if not self.coordinator.data:
-                return
+        available = self.coordinator.rf_available(
+            self.entity_description.protocol,
+            self.entity_description.id,
+            self.entity_description.unit,
+        )
+        if available == self._attr_available:
+            self.coordinator.suppressed_state_writes += 1
+            return
 
-            if (
-                self.coordinator.data.get("protocol")
-                != self.entity_description.protocol
-            ):
-                return
+        self._attr_available = available
+        self.async_write_ha_state()
 
-            if (
-                self.coordinator.data.get("values", {}).get("id")
-                != self.entity_description.id
-            ):
-                return
+    @callback
+    def _handle_rf_receive(self, decoded) -> None:
+        """Handle a RF packet addressed to this switch."""
+        values = decoded["values"]
+        if values.get("all", False) is True and self.entity_description.ignore_all:
+            return
 
-            if (
-                self.coordinator.data.get("values", {}).get("unit")
-                != self.entity_description.unit
-                and self.coordinator.data.get("values", {}).get("all", False) is False
-            ):
-                return
+        _LOGGER.debug(decoded)
 
-            if (
-                self.coordinator.data.get("values", {}).get("all", False) is True
-                and self.entity_description.ignore_all
-            ):
-                return
+        is_on = values.get("state")
+        if is_on == self._attr_is_on:
+            self.coordinator.suppressed_state_writes += 1
+            return
 
-            _LOGGER.debug(self.coordinator.data)
+        self._attr_is_on = is_on
+        self.async_write_ha_state()
 
-            self._attr_is_on = self.coordinator.data.get("values", {}).get("state")
+    @property
+    def rf_repeats(self) -> int:
+        """Return the number of repeats to send RF commands with."""
+        if not self.entity_description.adaptive_repeats:
+            return self.entity_description.repeats
 
-        self.async_write_ha_state()
+        return self.coordinator.rf_adaptive_repeats(
+            self.entity_description.protocol,
+            self.entity_description.id,
+            self.entity_description.unit,
+            self.entity_description.repeats,
+        )
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the entity on."""
@@ -274,7 +314,8 @@ class HomeduinoRFSwitch(CoordinatorEntity, SwitchEntity, RestoreEntity):
                 "unit": self.entity_description.unit,
                 "state": True,
             },
-            self.entity_description.repeats,
+            self.rf_repeats,
+            rf_priority(self._context),
         ):
             self._attr_is_on = True
             self.async_write_ha_state()
@@ -291,7 +332,8 @@ class HomeduinoRFSwitch(CoordinatorEntity, SwitchEntity, RestoreEntity):
                 "unit": self.entity_description.unit,
                 "state": False,
             },
-            self.entity_description.repeats,
+            self.rf_repeats,
+            rf_priority(self._context),
         ):
             self._attr_is_on = False
             self.async_write_ha_state()
@@ -0,0 +1,55 @@
+"""Homeduino transceiver connection for the Homeduino 433 MHz RF transceiver integration."""
+
+from collections.abc import Callable
+
+from homeduino import Homeduino
+
+
+class ConnectionTrackingHomeduino(Homeduino):
+    """Homeduino which reports when it gets connected and disconnected.
+
+    The homeduino library reconnects by itself shortly after losing the serial
+    connection, e.g. when the Arduino is reset or plugged in again. The Arduino
+    then lost its pin configuration, which the integration needs to know to
+    apply it again. Reporting the lost connection right away keeps the
+    availability of the entities up to date without polling.
+    """
+
+    _connection_callbacks: list[Callable[[bool], None]]
+
+    def __init__(
+        self,
+        serial_port: str,
+        baud_rate: int,
+        rf_receive_pin: int | None,
+        rf_send_pin: int | None,
+    ) -> None:
+        super().__init__(serial_port, baud_rate, rf_receive_pin, rf_send_pin)
+        self._connection_callbacks = []
+
+    def add_connection_callback(
+        self, connection_callback: Callable[[bool], None]
+    ) -> None:
+        """Call the callback with True when connected and False when disconnected."""
+        self._connection_callbacks.append(connection_callback)
+
+    def _connection_changed(self, connected: bool) -> None:
+        for connection_callback in self._connection_callbacks:
+            connection_callback(connected)
+
+    async def _connect(self) -> bool:
+        if not await super()._connect():
+            return False
+
+        # The protocol is created by the library, chain its connection_lost
+        protocol = self.protocol
+        connection_lost = protocol.connection_lost
+
+        def protocol_connection_lost(exc: Exception | None) -> None:
+            connection_lost(exc)
+            self._connection_changed(False)
+
+        protocol.connection_lost = protocol_connection_lost
+
+        self._connection_changed(True)
+        return True
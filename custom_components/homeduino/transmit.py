@@ -0,0 +1,567 @@
+"""RF transmit helpers for the Homeduino 433 MHz RF transceiver integration."""
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from functools import cache, partial
+
+from homeassistant.core import Context
+from rfcontrol import controller
+
+_LOGGER = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_AUTOMATION = 1
+PRIORITY_BULK = 2
+
+RF_BATCH_ROUNDS = 2
+RF_TRANSMIT_QUEUE_WINDOW = 0.05
+RF_AIRTIME_WINDOW = 60
+RF_ECHO_TIMEOUT = 3
+RF_ADAPTIVE_SUCCESSES = 5
+
+
+def rf_priority(context: Context | None) -> int:
+    """Return the transmit priority for a command sent in the given context.
+
+    Commands directly triggered by a user go ahead of commands sent by
+    automations and scripts.
+    """
+    if context is not None and context.user_id is not None:
+        return PRIORITY_INTERACTIVE
+
+    return PRIORITY_AUTOMATION
+
+
+def rf_airtime(protocol: str, values: dict, repeats: int) -> float:
+    """Estimate the airtime in seconds of a RF command including its repeats."""
+    try:
+        encoded = controller.encode_pulses(protocol, values)
+    except (controller.RFControlError, AttributeError, TypeError, ValueError):
+        return 0.0
+
+    pulse_lengths = encoded["pulse_lengths"]
+    return (
+        sum(pulse_lengths[int(pulse)] for pulse in encoded["pulses"])
+        * repeats
+        / 1000000
+    )
+
+
+def raw_rf_airtime(command: str, repeats: int) -> float:
+    """Estimate the airtime in seconds of a raw RF command including its repeats.
+
+    The command consists of 8 pulse lengths followed by the pulse sequence.
+    """
+    try:
+        parts = command.split(" ")
+        pulse_lengths = [int(pulse_length) for pulse_length in parts[0:8]]
+        return sum(pulse_lengths[int(pulse)] for pulse in parts[8]) * repeats / 1000000
+    except (IndexError, ValueError):
+        return 0.0
+
+
+class RFAirtimeBudget:
+    """Airtime accounting of a single transmitter over a sliding window."""
+
+    def __init__(self, duty_cycle: float, window: float = RF_AIRTIME_WINDOW) -> None:
+        self.duty_cycle = duty_cycle
+        self._window = window
+        self._transmissions: deque[tuple[float, float]] = deque()
+        self._airtime = 0.0
+
+        self.total_airtime = 0.0
+
+    def _expire(self, now: float) -> None:
+        while self._transmissions and self._transmissions[0][0] <= now - self._window:
+            _, airtime = self._transmissions.popleft()
+            self._airtime = max(0.0, self._airtime - airtime)
+
+    def add(self, airtime: float) -> None:
+        """Account a transmission."""
+        if airtime <= 0:
+            return
+
+        self._transmissions.append((time.monotonic(), airtime))
+        self._airtime += airtime
+        self.total_airtime += airtime
+
+    def utilisation(self) -> float:
+        """Return the used airtime as fraction of the window."""
+        self._expire(time.monotonic())
+        return self._airtime / self._window
+
+    def delay(self, airtime: float) -> float:
+        """Return the seconds to wait until the airtime fits the duty cycle."""
+        now = time.monotonic()
+        self._expire(now)
+
+        excess = self._airtime + airtime - self.duty_cycle * self._window
+        if self.duty_cycle >= 1 or excess <= 0:
+            return 0.0
+
+        for timestamp, used in self._transmissions:
+            excess -= used
+            if excess <= 0:
+                return timestamp + self._window - now
+
+        # The transmission on its own exceeds the duty cycle, wait for an idle window
+        if self._transmissions:
+            return self._transmissions[-1][0] + self._window - now
+
+        return 0.0
+
+
+class RFAdaptiveRepeats:
+    """Learn the minimal number of repeats RF devices need.
+
+    A device is only learned once its state is seen echoed after a command was
+    sent. Every number of consecutive echoes the repeats are lowered, a command
+    without echo raises the repeats again, up to twice the configured repeats.
+    """
+
+    def __init__(self, on_change: Callable[[], None] | None = None) -> None:
+        self._on_change = on_change
+        # Learned repeats per (protocol, id, unit)
+        self.learned: dict[tuple, int] = {}
+        self._configured: dict[tuple, int] = {}
+        self._successes: dict[tuple, int] = {}
+        self._expected: dict[tuple, tuple[dict, int, float]] = {}
+
+    def repeats(self, key: tuple, configured: int) -> int:
+        """Return the repeats to use for the device."""
+        self._configured[key] = configured
+        return self.learned.get(key, configured)
+
+    def sent(self, key: tuple, values: dict, repeats: int) -> None:
+        """Expect the echo of a command sent to an adaptive device."""
+        if key not in self._configured:
+            return
+
+        self._check_expired(key)
+        self._expected[key] = (values, repeats, time.monotonic() + RF_ECHO_TIMEOUT)
+
+    def received(self, key: tuple, values: dict) -> None:
+        """Handle a received packet which might be the echo of a sent command."""
+        if (expected := self._expected.get(key)) is None:
+            return
+
+        if self._check_expired(key):
+            return
+
+        expected_values, repeats, _ = expected
+        if any(
+            value is not None and values.get(name, value) != value
+            for name, value in expected_values.items()
+            if name not in ("id", "unit", "all")
+        ):
+            return
+
+        del self._expected[key]
+
+        if key not in self.learned:
+            self.learned[key] = repeats
+        else:
+            self._successes[key] = self._successes.get(key, 0) + 1
+            if self._successes[key] < RF_ADAPTIVE_SUCCESSES:
+                return
+            self.learned[key] = max(1, self.learned[key] - 1)
+        self._successes[key] = 0
+
+        if self._on_change is not None:
+            self._on_change()
+
+    def _check_expired(self, key: tuple) -> bool:
+        """Handle the missing echo of an expired command, returns True if expired."""
+        expected = self._expected.get(key)
+        if expected is None or time.monotonic() <= expected[2]:
+            return False
+
+        del self._expected[key]
+        self._successes[key] = 0
+
+        # Devices which never echoed can not be learned
+        if key in self.learned:
+            self.learned[key] = min(
+                self._configured.get(key, self.learned[key]) * 2,
+                self.learned[key] + 2,
+            )
+            if self._on_change is not None:
+                self._on_change()
+
+        return True
+
+
+class RFRoutingTable:
+    """Route the RF commands of a device to a preferred transceiver.
+
+    Routes are configured by hand or learned from the number of receptions per
+    transceiver. A configured transceiver takes precedence, the learned routes
+    order the transceivers by how well they hear the device.
+    """
+
+    def __init__(self, on_change: Callable[[], None] | None = None) -> None:
+        self._on_change = on_change
+        # Transceiver device IDs per (protocol, id, unit), best first
+        self.learned: dict[tuple, list[str]] = {}
+        self._configured: dict[tuple, str] = {}
+
+    def configure(self, key: tuple, device_id: str | None) -> Callable[[], None]:
+        """Configure the preferred transceiver, returns a callback to remove it."""
+        if device_id is None:
+            return lambda: None
+
+        self._configured[key] = device_id
+
+        def remove() -> None:
+            if self._configured.get(key) == device_id:
+                del self._configured[key]
+
+        return remove
+
+    def learn(self, key: tuple, receptions: dict[str, int]) -> None:
+        """Learn the route from the number of receptions per transceiver."""
+        route = sorted(receptions, key=receptions.__getitem__, reverse=True)
+        if self.learned.get(key) != route:
+            self.learned[key] = route
+            if self._on_change is not None:
+                self._on_change()
+
+    def _route(self, key: tuple) -> list[str]:
+        """Return all transceivers of the route, preferred first."""
+        route = self.learned.get(key, [])
+        if (configured := self._configured.get(key)) is not None:
+            route = [configured, *route]
+
+        return list(dict.fromkeys(route))
+
+    def route(self, key: tuple, candidates: list[str]) -> list[str]:
+        """Return the candidate transceivers to send with, preferred first.
+
+        An empty list is returned when no route is known.
+        """
+        return [device_id for device_id in self._route(key) if device_id in candidates]
+
+    def as_dict(self) -> dict[tuple, list[str]]:
+        """Return the routes, configured and learned."""
+        return {
+            key: self._route(key)
+            for key in dict.fromkeys((*self._configured, *self.learned))
+        }
+
+
+@cache
+def supports_group_command(protocol: str) -> bool:
+    """Test if the protocol can send all/group commands."""
+    rf_protocol = controller.get_protocol(protocol)
+    encode = getattr(rf_protocol, "encode", None)
+    if encode is None:
+        return False
+
+    return "all" in inspect.signature(encode).parameters
+
+
+def group_command(protocol: str, values_list: list[dict], units: set | None):
+    """Return the all/group command which replaces the given commands.
+
+    This is possible if the protocol supports group commands and all configured
+    units of the id get the same command, otherwise None is returned.
+    """
+    if (
+        len(values_list) < 2
+        or not units
+        or None in units
+        or not supports_group_command(protocol)
+    ):
+        return None
+
+    common = {k: v for k, v in values_list[0].items() if k != "unit"}
+    if common.get("all", False) or any(
+        {k: v for k, v in values.items() if k != "unit"} != common
+        for values in values_list[1:]
+    ):
+        return None
+
+    if not units <= {values.get("unit") for values in values_list}:
+        return None
+
+    return {**common, "unit": min(units), "all": True}
+
+
+def plan_rf_batch(
+    commands: list[tuple[str, dict]],
+    repeats: int,
+    rf_group_units: Callable[[str, int], set | None] | None = None,
+    rounds: int = RF_BATCH_ROUNDS,
+) -> list[list[tuple[str, dict, int]]]:
+    """Plan the transmission of a batch of RF commands.
+
+    Commands are grouped by protocol and id. If rf_group_units is given and all
+    units it returns for an id are switched to the same state a single all/group
+    command is sent instead. The repeats are spread over a number of rounds,
+    RF_BATCH_ROUNDS by default, so every device receives its first frames early
+    instead of sending device by device. Every round sends each frame again, so
+    two rounds double the number of serial sends and the gaps between them.
+
+    Returns the rounds as lists of (protocol, values, repeats).
+    """
+    grouped: dict[tuple, list[dict]] = {}
+    for protocol, values in commands:
+        grouped.setdefault((protocol, values.get("id")), []).append(values)
+
+    frames = []
+    for (protocol, id_), values_list in sorted(
+        grouped.items(), key=lambda item: item[0][0]
+    ):
+        if (
+            rf_group_units is not None
+            and len(values_list) > 1
+            and (
+                values := group_command(
+                    protocol, values_list, rf_group_units(protocol, id_)
+                )
+            )
+        ):
+            frames.append((protocol, values))
+        else:
+            frames.extend((protocol, values) for values in values_list)
+
+    rounds = max(1, min(rounds, repeats))
+    return [
+        [
+            (protocol, values, repeats // rounds + (1 if i < repeats % rounds else 0))
+            for protocol, values in frames
+        ]
+        for i in range(rounds)
+    ]
+
+
+class _RFTransmitJob:
+    """A command waiting in the transmit queue."""
+
+    def __init__(
+        self,
+        key,
+        priority: int,
+        rf_send,
+        frame: tuple | None,
+        airtime: float,
+        futures: list,
+    ) -> None:
+        self.key = key
+        self.priority = priority
+        self.rf_send = rf_send
+        self.frame = frame
+        self.airtime = airtime
+        self.futures = futures
+        self.enqueued = time.monotonic()
+        self.superseded = False
+
+
+class RFTransmitQueue:
+    """Prioritised transmit queue of a single transceiver.
+
+    Commands are sent one after another in order of priority. A command which is
+    still waiting is superseded by a newer command with the same key, only the
+    newer command is sent and both callers get its result.
+
+    When the commands waiting for all units rf_group_units returns for an id are
+    the same, they are collapsed into a single all/group command.
+
+    Commands which are not interactive are deferred while sending them would
+    exceed the duty cycle of the transmitter.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rf_group_units: Callable[[str, int], set | None],
+        rf_send: Callable[[str, dict, int], Awaitable[bool]],
+        duty_cycle: float = 1.0,
+    ) -> None:
+        self._name = name
+        self._rf_group_units = rf_group_units
+        self._rf_send = rf_send
+        self.airtime_budget = RFAirtimeBudget(duty_cycle)
+        self._heap: list[tuple[int, int, _RFTransmitJob]] = []
+        self._pending: dict[tuple, _RFTransmitJob] = {}
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+
+        self.depth = 0
+        self.max_depth = 0
+        self.sent = 0
+        self.coalesced = 0
+        self.grouped = 0
+        self.deferred = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    async def async_send(
+        self,
+        key: tuple | None,
+        rf_send: Callable[[], Awaitable[bool]],
+        priority: int = PRIORITY_AUTOMATION,
+        frame: tuple[str, dict, int] | None = None,
+        airtime: float = 0.0,
+    ) -> bool:
+        """Queue a command and wait for the result.
+
+        Commands without a key are never coalesced, commands without a (protocol,
+        values, repeats) frame are never grouped.
+        """
+        future = asyncio.get_running_loop().create_future()
+        job = _RFTransmitJob(key, priority, rf_send, frame, airtime, [future])
+
+        superseded = self._pending.get(key) if key is not None else None
+        if superseded is not None:
+            superseded.superseded = True
+            job.futures = superseded.futures + job.futures
+            job.enqueued = superseded.enqueued
+            job.priority = min(job.priority, superseded.priority)
+            self.coalesced += 1
+        else:
+            self.depth += 1
+            self.max_depth = max(self.max_depth, self.depth)
+
+        if key is not None:
+            self._pending[key] = job
+
+        heapq.heappush(self._heap, (job.priority, next(self._sequence), job))
+        self._wakeup.set()
+
+        return await future
+
+    async def async_run(self) -> None:
+        """Send the queued commands until cancelled."""
+        job = None
+        try:
+            while True:
+                if not self._heap:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    # Give concurrent callers, like the entities of a scene, the
+                    # opportunity to queue their commands
+                    await asyncio.sleep(RF_TRANSMIT_QUEUE_WINDOW)
+                    continue
+
+                entry = heapq.heappop(self._heap)
+                job = entry[2]
+                if job.superseded:
+                    continue
+
+                if job.priority > PRIORITY_INTERACTIVE and (
+                    delay := self.airtime_budget.delay(job.airtime)
+                ):
+                    # Wait for the airtime to become available or for a new command,
+                    # which might have a higher priority
+                    heapq.heappush(self._heap, entry)
+                    job = None
+                    self.deferred += 1
+                    self._wakeup.clear()
+                    with suppress(TimeoutError):
+                        async with asyncio.timeout(delay):
+                            await self._wakeup.wait()
+                    continue
+
+                self.depth -= 1
+                if job.key is not None and self._pending.get(job.key) is job:
+                    del self._pending[job.key]
+
+                job = self._group(job)
+
+                wait_time = time.monotonic() - job.enqueued
+                self.total_wait_time += wait_time
+                self.max_wait_time = max(self.max_wait_time, wait_time)
+
+                self.airtime_budget.add(job.airtime)
+                try:
+                    result = await job.rf_send()
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception(
+                        "Unexpected error while sending with %s", self._name
+                    )
+                    result = False
+                self.sent += 1
+
+                # Superseded callers are resolved first, so the latest command wins
+                for future in job.futures:
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            # Commands in progress or still waiting are reported as failed
+            jobs = [job] if job is not None else []
+            jobs.extend(job for _, _, job in self._heap)
+            for job in jobs:
+                for future in job.futures:
+                    if not future.done():
+                        future.set_result(False)
+            self._heap.clear()
+            self._pending.clear()
+            self.depth = 0
+
+    def _group(self, job: _RFTransmitJob) -> _RFTransmitJob:
+        """Collapse the job and the waiting jobs for the other units of the id."""
+        if job.frame is None:
+            return job
+
+        protocol, values, _ = job.frame
+        units = self._rf_group_units(protocol, values.get("id"))
+        if not units or len(units) < 2 or values.get("unit") not in units:
+            return job
+
+        jobs = [job] + [
+            other
+            for other in self._pending.values()
+            if other.frame is not None
+            and other.frame[0] == protocol
+            and other.frame[1].get("id") == values.get("id")
+            and other.frame[1].get("unit") in units
+        ]
+        group_values = group_command(
+            protocol, [other.frame[1] for other in jobs], units
+        )
+        if group_values is None:
+            return job
+
+        for other in jobs[1:]:
+            other.superseded = True
+            del self._pending[other.key]
+            self.depth -= 1
+        self.grouped += len(jobs) - 1
+
+        repeats = max(other.frame[2] for other in jobs)
+        group_job = _RFTransmitJob(
+            None,
+            job.priority,
+            partial(self._rf_send, protocol, group_values, repeats),
+            (protocol, group_values, repeats),
+            rf_airtime(protocol, group_values, repeats),
+            [future for other in jobs for future in other.futures],
+        )
+        group_job.enqueued = min(other.enqueued for other in jobs)
+
+        return group_job
+
+    def get_diagnostics(self) -> dict:
+        """Return the queue statistics for diagnostics."""
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "sent": self.sent,
+            "coalesced": self.coalesced,
+            "grouped": self.grouped,
+            "deferred": self.deferred,
+            "utilisation": self.airtime_budget.utilisation(),
+            "total_airtime": self.airtime_budget.total_airtime,
+            "average_wait_time": (
+                self.total_wait_time / self.sent if self.sent else None
+            ),
+            "max_wait_time": self.max_wait_time,
+        }
@@ -0,0 +1,66 @@
+"""Triggers for received Homeduino RF packets."""
+
+import voluptuous as vol
+from homeassistant.const import CONF_PLATFORM
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+from homeassistant.helpers.typing import ConfigType
+
+from . import HomeduinoCoordinator
+from .const import CONF_RF_ID, CONF_RF_PROTOCOL, CONF_RF_UNIT, DOMAIN
+
+TRIGGER_SCHEMA = cv.TRIGGER_BASE_SCHEMA.extend(
+    {
+        vol.Required(CONF_PLATFORM): DOMAIN,
+        vol.Required(CONF_RF_PROTOCOL): cv.string,
+        vol.Required(CONF_RF_ID): cv.positive_int,
+        vol.Optional(CONF_RF_UNIT): cv.positive_int,
+    }
+)
+
+
+async def async_validate_trigger_config(
+    hass: HomeAssistant, config: ConfigType
+) -> ConfigType:
+    """Validate trigger config."""
+    return TRIGGER_SCHEMA(config)
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Listen for RF packets of a protocol, id and optionally unit."""
+    trigger_data = trigger_info["trigger_data"]
+    protocol = config[CONF_RF_PROTOCOL]
+    id_ = config[CONF_RF_ID]
+    unit = config.get(CONF_RF_UNIT)
+    job = HassJob(action, f"homeduino trigger {trigger_info}")
+
+    @callback
+    def rf_trigger(decoded) -> None:
+        values = decoded["values"]
+        if unit is not None and values.get("unit") != unit:
+            return
+
+        hass.async_run_hass_job(
+            job,
+            {
+                "trigger": {
+                    **trigger_data,
+                    CONF_PLATFORM: DOMAIN,
+                    CONF_RF_PROTOCOL: protocol,
+                    CONF_RF_ID: id_,
+                    CONF_RF_UNIT: values.get("unit"),
+                    "values": values,
+                    "description": f"RF packet {protocol} {id_}",
+                }
+            },
+        )
+
+    return HomeduinoCoordinator.instance(hass).async_add_rf_trigger(
+        rf_trigger, protocol, id_
+    )
@@ -0,0 +1,313 @@
+"""Simulated Homeduino transceiver for testing without hardware.
+
+Speaks the line protocol of the homeduino sketch over a pseudo terminal or a TCP
+socket and injects received RF packets at a configurable rate, e.g.:
+
+    python scripts/homeduino_simulator.py --pty --rf switch1:98765:0 --rate 5
+    python scripts/homeduino_simulator.py --tcp 127.0.0.1:5000 --echo --drop 0.1
+
+Use the printed pty path or socket://127.0.0.1:5000 as serial port of the
+Homeduino transceiver. Jitter, dropped packets, ACK latency and unanswered
+commands can be simulated to test the connect, ping and send paths.
+"""
+
+import argparse
+import asyncio
+import inspect
+import logging
+import os
+import random
+import time
+import tty
+
+from rfcontrol import controller
+
+_LOGGER = logging.getLogger("homeduino_simulator")
+
+
+def _encode_rf_packet(protocol_name: str, values: dict) -> str:
+    """Return the pulse lengths and pulse sequence of a RF packet."""
+    protocol = controller.get_protocol(protocol_name)
+    if protocol is None or getattr(protocol, "encode", None) is None:
+        raise ValueError(f"Protocol {protocol_name} has no send support")
+
+    # Only pass the values the protocol encodes
+    parameters = inspect.signature(protocol.encode).parameters
+    pulse_sequence = protocol.encode(
+        **{key: value for key, value in values.items() if key in parameters}
+    )
+    pulse_lengths = list(protocol.pulse_lengths)
+    pulse_lengths += [0] * (8 - len(pulse_lengths))
+
+    return " ".join(str(x) for x in pulse_lengths) + " " + pulse_sequence
+
+
+class HomeduinoSimulator:
+    """Answer the commands of the homeduino sketch and inject RF packets."""
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        self._args = args
+        self._write = None
+        self._buffer = ""
+        self._digital = {}
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+
+        # Number of commands answered, not answered and RF packets injected
+        self.commands = 0
+        self.timeouts = 0
+        self.injected = 0
+        self.dropped = 0
+
+    def connection_made(self, write) -> None:
+        """Start a new session, the sketch reports ready after a reset."""
+        self._write = write
+        self._buffer = ""
+        self._write_line("ready")
+
+    def connection_lost(self) -> None:
+        self._write = None
+
+    def _write_line(self, line: str) -> None:
+        if self._write is not None:
+            _LOGGER.debug("> %s", line)
+            self._write((line + "\r\n").encode())
+
+    def data_received(self, data: bytes) -> None:
+        self._buffer += data.decode(errors="replace")
+        while "\n" in self._buffer:
+            line, self._buffer = self._buffer.split("\n", 1)
+            if line := line.strip():
+                self._queue.put_nowait(line)
+
+    async def run_commands(self) -> None:
+        """Answer the commands one by one, like the sketch does."""
+        while True:
+            line = await self._queue.get()
+            _LOGGER.debug("< %s", line)
+
+            if random.random() < self._args.timeout:
+                self.timeouts += 1
+                continue
+
+            latency = self._args.ack_latency
+            if self._args.ack_jitter:
+                latency += random.uniform(0, self._args.ack_jitter)
+            if latency > 0:
+                await asyncio.sleep(latency)
+
+            self.commands += 1
+            for response in self._handle_command(line):
+                self._write_line(response)
+
+    def _handle_command(self, line: str) -> list[str]:
+        """Return the response lines of a command."""
+        args = line.split(" ")
+        command = args[0]
+        if command == "PING":
+            return [line]
+        if command == "RF" and args[1:2] == ["receive"]:
+            return ["ACK"]
+        if command == "RF" and args[1:2] == ["send"] and len(args) == 13:
+            if self._args.echo:
+                # Echo the packet back as if a RF device reports its new state
+                asyncio.get_running_loop().call_later(
+                    self._args.ack_latency + 0.05,
+                    self._write_line,
+                    "RF receive " + " ".join(args[4:]),
+                )
+            return ["ACK"]
+        if command in ("PM", "DW") and len(args) == 3:
+            if command == "DW":
+                self._digital[args[1]] = args[2]
+            return ["ACK"]
+        if command == "DR" and len(args) == 2:
+            return [f"ACK {self._digital.get(args[1], '0')}"]
+        if command == "AR" and len(args) == 2:
+            return [f"ACK {random.randint(0, 1023)}"]
+        if command == "DHT" and len(args) == 3:
+            temperature = round(random.uniform(18, 24), 1)
+            humidity = round(random.uniform(40, 60), 1)
+            return [f"ACK {temperature} {humidity}"]
+
+        return ["ERR unknown_command"]
+
+    async def inject_rf_packets(self) -> None:
+        """Inject received RF packets at the configured rate."""
+        if not (self._args.rf or self._args.raw) or self._args.rate <= 0:
+            return
+
+        interval = 1 / self._args.rate
+        next_time = time.monotonic()
+        while True:
+            next_time += interval * (
+                1 + random.uniform(-self._args.jitter, self._args.jitter)
+            )
+            await asyncio.sleep(max(0, next_time - time.monotonic()))
+            if self._write is None:
+                continue
+
+            if random.random() < self._args.drop:
+                self.dropped += 1
+                continue
+
+            self.injected += 1
+            self._write_line("RF receive " + self._rf_packet())
+
+    def _rf_packet(self) -> str:
+        """Return a random RF packet of the configured devices."""
+        packets = [("rf", x) for x in self._args.rf] + [
+            ("raw", x) for x in self._args.raw
+        ]
+        kind, packet = random.choice(packets)
+        if kind == "raw":
+            return packet
+
+        protocol, id_, *unit = packet.split(":")
+        return _encode_rf_packet(
+            protocol,
+            {
+                "id": int(id_),
+                "unit": int(unit[0]) if unit else 0,
+                "state": random.random() < 0.5,
+                "dimlevel": random.randint(0, 15),
+            },
+        )
+
+    async def report(self) -> None:
+        """Log the counters periodically."""
+        while True:
+            await asyncio.sleep(10)
+            _LOGGER.info(
+                "Commands: %i, timeouts: %i, RF injected: %i, RF dropped: %i",
+                self.commands,
+                self.timeouts,
+                self.injected,
+                self.dropped,
+            )
+
+
+async def _serve_pty(simulator: HomeduinoSimulator) -> None:
+    """Serve the simulator on a pseudo terminal."""
+    master, slave = os.openpty()
+    tty.setraw(slave)
+    print(os.ttyname(slave), flush=True)
+
+    loop = asyncio.get_running_loop()
+
+    def read() -> None:
+        try:
+            data = os.read(master, 1024)
+        except OSError:
+            return
+        simulator.data_received(data)
+
+    def write(data: bytes) -> None:
+        os.write(master, data)
+
+    simulator.connection_made(write)
+    loop.add_reader(master, read)
+    await asyncio.Event().wait()
+
+
+async def _serve_tcp(simulator: HomeduinoSimulator, address: str) -> None:
+    """Serve the simulator on a TCP socket, one client at a time."""
+    host, port = address.rsplit(":", 1)
+
+    async def handle_client(reader, writer) -> None:
+        _LOGGER.info("Client connected")
+        simulator.connection_made(writer.write)
+        try:
+            while data := await reader.read(1024):
+                simulator.data_received(data)
+        finally:
+            simulator.connection_lost()
+            writer.close()
+            _LOGGER.info("Client disconnected")
+
+    server = await asyncio.start_server(handle_client, host, int(port))
+    print(f"socket://{address}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+async def main(args: argparse.Namespace) -> None:
+    simulator = HomeduinoSimulator(args)
+
+    tasks = [
+        simulator.run_commands(),
+        simulator.inject_rf_packets(),
+        simulator.report(),
+    ]
+    if args.tcp:
+        tasks.append(_serve_tcp(simulator, args.tcp))
+    else:
+        tasks.append(_serve_pty(simulator))
+
+    await asyncio.gather(*tasks)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    endpoint = parser.add_mutually_exclusive_group(required=True)
+    endpoint.add_argument("--pty", action="store_true", help="serve on a pty")
+    endpoint.add_argument("--tcp", metavar="HOST:PORT", help="serve on a TCP port")
+    parser.add_argument(
+        "--rf",
+        action="append",
+        default=[],
+        metavar="PROTOCOL:ID[:UNIT]",
+        help="RF device to inject packets of, e.g. switch1:98765:0",
+    )
+    parser.add_argument(
+        "--raw",
+        action="append",
+        default=[],
+        metavar="PULSES",
+        help="raw RF packet to inject, 8 pulse lengths and the pulse sequence",
+    )
+    parser.add_argument(
+        "--rate", type=float, default=1, help="RF packets per second (default 1)"
+    )
+    parser.add_argument(
+        "--jitter",
+        type=float,
+        default=0,
+        help="relative jitter of the RF packet interval, 0 to 1 (default 0)",
+    )
+    parser.add_argument(
+        "--drop",
+        type=float,
+        default=0,
+        help="probability a RF packet is dropped (default 0)",
+    )
+    parser.add_argument(
+        "--ack-latency",
+        type=float,
+        default=0.01,
+        help="seconds before a command is answered (default 0.01)",
+    )
+    parser.add_argument(
+        "--ack-jitter",
+        type=float,
+        default=0,
+        help="maximum seconds added to the ACK latency (default 0)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=0,
+        help="probability a command is not answered (default 0)",
+    )
+    parser.add_argument(
+        "--echo",
+        action="store_true",
+        help="echo sent RF packets back as received",
+    )
+    parser.add_argument("--debug", action="store_true", help="log all lines")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO)
+    try:
+        asyncio.run(main(args))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1 @@
+"""Tests for the Homeduino 433 MHz RF transceiver integration."""
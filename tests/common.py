@@ -0,0 +1,17 @@
+"""Helpers for the Homeduino integration tests."""
+
+
+class FakeClock:
+    """Stand-in for the time module which only moves when advanced."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
@@ -0,0 +1,19 @@
+"""Fixtures for the Homeduino integration tests."""
+
+import pytest
+
+from custom_components.homeduino import HomeduinoCoordinator
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable the custom integration in all tests."""
+    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_coordinator():
+    """Start every test with a new coordinator instance."""
+    HomeduinoCoordinator._instance = None
+    yield
+    HomeduinoCoordinator._instance = None
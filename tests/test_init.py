@@ -0,0 +1,38 @@
+"""Tests for the Homeduino coordinator."""
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.homeduino import HomeduinoCoordinator
+
+
+async def test_rf_group_units_opt_in(hass: HomeAssistant) -> None:
+    """Test group commands are only used when all units opted in."""
+    coordinator = HomeduinoCoordinator.instance(hass)
+    for unit in (0, 1):
+        coordinator.async_add_rf_listener(
+            lambda decoded: None, "switch1", 1, unit, group=True
+        )
+
+    assert coordinator.rf_group_units("switch1", 1) is None
+    assert coordinator.rf_group_units("switch1", 1, opted_in=False) == {0, 1}
+
+    coordinator.async_set_rf_group_commands("switch1", 1, 0)
+    assert coordinator.rf_group_units("switch1", 1) is None
+
+    remove = coordinator.async_set_rf_group_commands("switch1", 1, 1)
+    assert coordinator.rf_group_units("switch1", 1) == {0, 1}
+
+    remove()
+    assert coordinator.rf_group_units("switch1", 1) is None
+
+
+async def test_rf_group_units_ignore_all(hass: HomeAssistant) -> None:
+    """Test no group commands are used when a unit ignores them."""
+    coordinator = HomeduinoCoordinator.instance(hass)
+    coordinator.async_add_rf_listener(lambda decoded: None, "switch1", 1, 0, group=True)
+    coordinator.async_add_rf_listener(lambda decoded: None, "switch1", 1, 1)
+    for unit in (0, 1):
+        coordinator.async_set_rf_group_commands("switch1", 1, unit)
+
+    assert coordinator.rf_group_units("switch1", 1) is None
+    assert coordinator.rf_group_units("switch1", 1, opted_in=False) is None
@@ -0,0 +1,161 @@
+"""Tests for the RF receive helpers."""
+
+import pytest
+
+from custom_components.homeduino import receive
+from custom_components.homeduino.receive import RFCandidateTable, RFDeduplicator
+
+from .common import FakeClock
+
+ON = {"id": 98765, "unit": 0, "all": False, "state": True}
+OFF = {"id": 98765, "unit": 0, "all": False, "state": False}
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    """Control the time seen by the receive helpers."""
+    clock = FakeClock()
+    monkeypatch.setattr(receive, "time", clock)
+    return clock
+
+
+def test_duplicate_within_window(clock: FakeClock) -> None:
+    """Test a copy received within the window is a duplicate."""
+    deduplicator = RFDeduplicator({})
+
+    assert not deduplicator.is_duplicate("switch1", ON, 0.5)
+    clock.advance(0.1)
+    assert deduplicator.is_duplicate("switch1", ON, 0.5)
+    assert deduplicator.duplicates == {"switch1": 1}
+
+    clock.advance(1)
+    assert not deduplicator.is_duplicate("switch1", ON, 0.5)
+
+
+def test_other_values_are_no_duplicate(clock: FakeClock) -> None:
+    """Test a packet with other values is not a duplicate."""
+    deduplicator = RFDeduplicator({})
+
+    assert not deduplicator.is_duplicate("switch1", ON, 0.5)
+    assert not deduplicator.is_duplicate("switch1", OFF, 0.5)
+    assert not deduplicator.is_duplicate("switch2", ON, 0.5)
+
+
+def test_window_zero_disables(clock: FakeClock) -> None:
+    """Test a window of 0 disables the de-duplication."""
+    deduplicator = RFDeduplicator({})
+
+    assert not deduplicator.is_duplicate("switch1", ON, 0)
+    assert not deduplicator.is_duplicate("switch1", ON, 0)
+
+
+def test_burst_is_collapsed(clock: FakeClock) -> None:
+    """Test a burst of repeats longer than the window is collapsed."""
+    deduplicator = RFDeduplicator({})
+
+    assert not deduplicator.is_duplicate("switch1", ON, 0.5)
+    for _ in range(5):
+        clock.advance(0.4)
+        assert deduplicator.is_duplicate("switch1", ON, 0.5)
+
+
+def test_family_window(clock: FakeClock) -> None:
+    """Test the window is extended to the window of the protocol family."""
+    deduplicator = RFDeduplicator({"weather": 2.0})
+
+    assert not deduplicator.is_duplicate("weather5", {"id": 1, "temperature": 21}, 0.5)
+    clock.advance(1.5)
+    assert deduplicator.is_duplicate("weather5", {"id": 1, "temperature": 21}, 0.5)
+
+
+def test_copies_of_other_transceivers(clock: FakeClock) -> None:
+    """Test copies heard by other transceivers are merged into one reception."""
+    receptions = []
+    deduplicator = RFDeduplicator(
+        {}, on_reception=lambda protocol, values, source: receptions.append(source)
+    )
+
+    assert not deduplicator.is_duplicate("switch1", ON, 0, "a")
+    clock.advance(0.1)
+    assert deduplicator.is_duplicate("switch1", ON, 0, "b")
+    assert deduplicator.merged == {"switch1": 1}
+    assert receptions == ["a", "b"]
+
+
+def test_bounded(clock: FakeClock) -> None:
+    """Test the least recently seen packet is evicted when full."""
+    deduplicator = RFDeduplicator({}, max_size=2)
+
+    for unit in range(3):
+        assert not deduplicator.is_duplicate("switch1", {**ON, "unit": unit}, 0.5)
+
+    assert not deduplicator.is_duplicate("switch1", ON, 0.5)
+
+
+def _hit(candidates: RFCandidateTable, key: tuple, clock: FakeClock) -> bool:
+    clock.advance(2)
+    return candidates.hit(key)
+
+
+def test_candidate_discovered(clock: FakeClock) -> None:
+    """Test a candidate is discovered once after enough hits."""
+    candidates = RFCandidateTable()
+    key = ("switch1", 98765, 0)
+
+    assert not _hit(candidates, key, clock)
+    assert not _hit(candidates, key, clock)
+    assert not candidates.is_discovered(key)
+    assert _hit(candidates, key, clock)
+    assert candidates.is_discovered(key)
+    assert not _hit(candidates, key, clock)
+    assert candidates.discoveries == 1
+
+    candidates.discard(key)
+    assert not candidates.is_discovered(key)
+
+
+def test_candidate_repeats_count_once(clock: FakeClock) -> None:
+    """Test the repeats of one transmission count as a single hit."""
+    candidates = RFCandidateTable()
+    key = ("switch1", 98765, 0)
+
+    for _ in range(10):
+        clock.advance(0.1)
+        assert not candidates.hit(key)
+    assert candidates.as_dict()[key].hits == 1
+
+
+def test_candidate_window(clock: FakeClock) -> None:
+    """Test the hits need to be heard within the window."""
+    candidates = RFCandidateTable(window=300)
+    key = ("switch1", 98765, 0)
+
+    assert not _hit(candidates, key, clock)
+    assert not _hit(candidates, key, clock)
+    clock.advance(300)
+    assert not _hit(candidates, key, clock)
+    assert candidates.as_dict()[key].hits == 1
+
+
+def test_candidate_rate_limit(clock: FakeClock) -> None:
+    """Test discoveries are rate limited."""
+    candidates = RFCandidateTable(hits=1, interval=60)
+
+    assert _hit(candidates, ("switch1", 1, 0), clock)
+    assert not _hit(candidates, ("switch1", 2, 0), clock)
+    assert candidates.rate_limited == 1
+
+    clock.advance(60)
+    assert _hit(candidates, ("switch1", 2, 0), clock)
+    assert candidates.discoveries == 2
+
+
+def test_candidate_eviction(clock: FakeClock) -> None:
+    """Test the least recently heard candidate is evicted."""
+    candidates = RFCandidateTable(max_size=2)
+
+    _hit(candidates, ("switch1", 1, 0), clock)
+    _hit(candidates, ("switch1", 2, 0), clock)
+    _hit(candidates, ("switch1", 1, 0), clock)
+    _hit(candidates, ("switch1", 3, 0), clock)
+    assert list(candidates.as_dict()) == [("switch1", 1, 0), ("switch1", 3, 0)]
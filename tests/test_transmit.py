@@ -0,0 +1,364 @@
+"""Tests for the RF transmit helpers."""
+
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable
+
+import pytest
+
+from custom_components.homeduino import transmit
+from custom_components.homeduino.transmit import (
+    PRIORITY_BULK,
+    PRIORITY_INTERACTIVE,
+    RF_ADAPTIVE_SUCCESSES,
+    RF_ECHO_TIMEOUT,
+    RFAdaptiveRepeats,
+    RFAirtimeBudget,
+    RFTransmitQueue,
+    group_command,
+    plan_rf_batch,
+)
+
+from .common import FakeClock
+
+
+def _sender(sent: list, name: str) -> Callable[[], Awaitable[bool]]:
+    """Return a command which records its name when sent."""
+
+    async def rf_send() -> bool:
+        sent.append(name)
+        return True
+
+    return rf_send
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    """Control the time seen by the airtime accounting."""
+    clock = FakeClock()
+    monkeypatch.setattr(transmit, "time", clock)
+    return clock
+
+
+@pytest.fixture
+async def queue() -> AsyncGenerator[RFTransmitQueue]:
+    """Return a running transmit queue."""
+    queue = RFTransmitQueue("test", lambda protocol, id_: None, None)
+    task = asyncio.create_task(queue.async_run())
+    yield queue
+    task.cancel()
+
+
+async def test_queue_coalesces_commands(queue: RFTransmitQueue) -> None:
+    """Test a waiting command is superseded by a newer one with the same key."""
+    sent = []
+
+    results = await asyncio.gather(
+        queue.async_send(("switch1", 1, 0), _sender(sent, "on")),
+        queue.async_send(("switch1", 1, 0), _sender(sent, "off")),
+        queue.async_send(("switch1", 1, 1), _sender(sent, "other")),
+    )
+
+    assert results == [True, True, True]
+    assert sent == ["off", "other"]
+    assert queue.coalesced == 1
+    assert queue.sent == 2
+
+
+async def test_queue_without_key_is_not_coalesced(queue: RFTransmitQueue) -> None:
+    """Test commands without a key are all sent."""
+    sent = []
+
+    await asyncio.gather(
+        queue.async_send(None, _sender(sent, "first")),
+        queue.async_send(None, _sender(sent, "second")),
+    )
+
+    assert sent == ["first", "second"]
+    assert queue.coalesced == 0
+
+
+async def test_queue_priority(queue: RFTransmitQueue) -> None:
+    """Test interactive commands go ahead of waiting bulk commands."""
+    sent = []
+
+    await asyncio.gather(
+        queue.async_send(None, _sender(sent, "bulk"), PRIORITY_BULK),
+        queue.async_send(None, _sender(sent, "automation")),
+        queue.async_send(None, _sender(sent, "interactive"), PRIORITY_INTERACTIVE),
+    )
+
+    assert sent == ["interactive", "automation", "bulk"]
+
+
+async def test_queue_coalesced_priority(queue: RFTransmitQueue) -> None:
+    """Test a coalesced command keeps the highest priority."""
+    sent = []
+
+    await asyncio.gather(
+        queue.async_send(None, _sender(sent, "automation")),
+        queue.async_send(
+            ("switch1", 1, 0), _sender(sent, "interactive"), PRIORITY_INTERACTIVE
+        ),
+        queue.async_send(("switch1", 1, 0), _sender(sent, "bulk"), PRIORITY_BULK),
+    )
+
+    assert sent == ["bulk", "automation"]
+
+
+async def test_queue_groups_commands() -> None:
+    """Test the same command for all group units is sent as one group command."""
+    sent = []
+
+    async def rf_send(protocol: str, values: dict, repeats: int) -> bool:
+        sent.append((protocol, values, repeats))
+        return True
+
+    queue = RFTransmitQueue("test", lambda protocol, id_: {0, 1}, rf_send)
+    task = asyncio.create_task(queue.async_run())
+    try:
+        results = await asyncio.gather(
+            *(
+                queue.async_send(
+                    ("switch1", 1, unit),
+                    _sender([], f"unit {unit}"),
+                    frame=("switch1", {"id": 1, "unit": unit, "state": True}, 4),
+                )
+                for unit in (0, 1)
+            )
+        )
+    finally:
+        task.cancel()
+
+    assert results == [True, True]
+    assert sent == [("switch1", {"id": 1, "unit": 0, "state": True, "all": True}, 4)]
+    assert queue.grouped == 1
+
+
+async def test_queue_cancelled() -> None:
+    """Test waiting commands fail when the queue is stopped."""
+    queue = RFTransmitQueue("test", lambda protocol, id_: None, None)
+    task = asyncio.create_task(queue.async_run())
+    waiting = asyncio.ensure_future(queue.async_send(None, _sender([], "waiting")))
+    await asyncio.sleep(0)
+
+    task.cancel()
+
+    assert await waiting is False
+
+
+def test_plan_rf_batch_rounds() -> None:
+    """Test the repeats of a batch are spread over rounds of all frames."""
+    commands = [
+        ("switch1", {"id": 1, "unit": 0, "state": True}),
+        ("dimmer1", {"id": 2, "unit": 1, "dimlevel": 8}),
+    ]
+
+    rounds = plan_rf_batch(commands, 7)
+
+    assert rounds == [
+        [
+            ("dimmer1", {"id": 2, "unit": 1, "dimlevel": 8}, 4),
+            ("switch1", {"id": 1, "unit": 0, "state": True}, 4),
+        ],
+        [
+            ("dimmer1", {"id": 2, "unit": 1, "dimlevel": 8}, 3),
+            ("switch1", {"id": 1, "unit": 0, "state": True}, 3),
+        ],
+    ]
+
+
+def test_plan_rf_batch_single_repeat() -> None:
+    """Test a batch sent once is planned as a single round."""
+    rounds = plan_rf_batch([("switch1", {"id": 1, "unit": 0, "state": True})], 1)
+
+    assert rounds == [[("switch1", {"id": 1, "unit": 0, "state": True}, 1)]]
+
+
+def test_plan_rf_batch_group() -> None:
+    """Test the same command for all group units is planned as one group command."""
+    commands = [
+        ("switch1", {"id": 1, "unit": 0, "state": False}),
+        ("switch1", {"id": 1, "unit": 1, "state": False}),
+    ]
+
+    assert plan_rf_batch(commands, 1, lambda protocol, id_: {0, 1}) == [
+        [("switch1", {"id": 1, "unit": 0, "state": False, "all": True}, 1)]
+    ]
+    assert plan_rf_batch(commands, 1) == [
+        [
+            ("switch1", {"id": 1, "unit": 0, "state": False}, 1),
+            ("switch1", {"id": 1, "unit": 1, "state": False}, 1),
+        ]
+    ]
+
+
+@pytest.mark.parametrize(
+    ("protocol", "values_list", "units"),
+    [
+        # A single command
+        ("switch1", [{"id": 1, "unit": 0, "state": True}], {0}),
+        # Not all units get a command
+        (
+            "switch1",
+            [{"id": 1, "unit": 0, "state": True}, {"id": 1, "unit": 1, "state": True}],
+            {0, 1, 2},
+        ),
+        # The units get different commands
+        (
+            "switch1",
+            [{"id": 1, "unit": 0, "state": True}, {"id": 1, "unit": 1, "state": False}],
+            {0, 1},
+        ),
+        # No group units
+        (
+            "switch1",
+            [{"id": 1, "unit": 0, "state": True}, {"id": 1, "unit": 1, "state": True}],
+            None,
+        ),
+        # The protocol can not send group commands
+        (
+            "contact1",
+            [{"id": 1, "unit": 0, "state": True}, {"id": 1, "unit": 1, "state": True}],
+            {0, 1},
+        ),
+    ],
+)
+def test_group_command_not_possible(
+    protocol: str, values_list: list[dict], units: set | None
+) -> None:
+    """Test no group command replaces commands which differ or miss units."""
+    assert group_command(protocol, values_list, units) is None
+
+
+def test_group_command() -> None:
+    """Test the group command of the lowest unit replaces the commands."""
+    values_list = [
+        {"id": 1, "unit": 2, "state": True},
+        {"id": 1, "unit": 1, "state": True},
+    ]
+
+    assert group_command("switch1", values_list, {1, 2}) == {
+        "id": 1,
+        "unit": 1,
+        "state": True,
+        "all": True,
+    }
+
+
+def test_airtime_budget_utilisation(clock: FakeClock) -> None:
+    """Test the used airtime expires after the window."""
+    budget = RFAirtimeBudget(0.1, 60)
+
+    budget.add(3)
+    budget.add(0)
+    assert budget.utilisation() == pytest.approx(0.05)
+
+    clock.advance(60)
+    assert budget.utilisation() == 0
+    assert budget.total_airtime == 3
+
+
+def test_airtime_budget_delay(clock: FakeClock) -> None:
+    """Test a transmission is delayed until it fits the duty cycle."""
+    budget = RFAirtimeBudget(0.1, 60)
+
+    budget.add(3)
+    clock.advance(10)
+    budget.add(2)
+
+    assert budget.delay(1) == 0
+    # The first transmission needs to expire to fit 2 more seconds
+    assert budget.delay(2) == pytest.approx(50)
+
+    clock.advance(50)
+    assert budget.delay(2) == 0
+
+
+def test_airtime_budget_long_transmission(clock: FakeClock) -> None:
+    """Test a transmission exceeding the duty cycle waits for an idle window."""
+    budget = RFAirtimeBudget(0.1, 60)
+
+    assert budget.delay(10) == 0
+
+    budget.add(1)
+    clock.advance(5)
+    assert budget.delay(10) == pytest.approx(55)
+
+
+def test_airtime_budget_unlimited(clock: FakeClock) -> None:
+    """Test a duty cycle of 100% never delays."""
+    budget = RFAirtimeBudget(1.0, 60)
+
+    budget.add(60)
+    assert budget.delay(60) == 0
+
+
+KEY = ("switch1", 1234, 0)
+
+
+def _echo(adaptive: RFAdaptiveRepeats, repeats: int, state: bool = True) -> None:
+    adaptive.sent(KEY, {"id": 1234, "unit": 0, "state": state}, repeats)
+    adaptive.received(KEY, {"id": 1234, "unit": 0, "state": state})
+
+
+def test_adaptive_repeats_learn(clock: FakeClock) -> None:
+    """Test the repeats are learned from the echo and lowered on success."""
+    changes = []
+    adaptive = RFAdaptiveRepeats(lambda: changes.append(True))
+
+    assert adaptive.repeats(KEY, 7) == 7
+    _echo(adaptive, 7)
+    assert adaptive.learned == {KEY: 7}
+    assert len(changes) == 1
+
+    for _ in range(RF_ADAPTIVE_SUCCESSES - 1):
+        _echo(adaptive, adaptive.repeats(KEY, 7))
+    assert adaptive.repeats(KEY, 7) == 7
+
+    _echo(adaptive, adaptive.repeats(KEY, 7))
+    assert adaptive.repeats(KEY, 7) == 6
+    assert len(changes) == 2
+
+
+def test_adaptive_repeats_other_state(clock: FakeClock) -> None:
+    """Test a packet with another state is not an echo."""
+    adaptive = RFAdaptiveRepeats()
+    adaptive.repeats(KEY, 7)
+
+    adaptive.sent(KEY, {"id": 1234, "unit": 0, "state": True}, 7)
+    adaptive.received(KEY, {"id": 1234, "unit": 0, "state": False})
+    assert adaptive.learned == {}
+
+
+def test_adaptive_repeats_missed_echo(clock: FakeClock) -> None:
+    """Test a missing echo raises the repeats up to twice the configured."""
+    adaptive = RFAdaptiveRepeats()
+    adaptive.repeats(KEY, 3)
+    _echo(adaptive, 3)
+
+    for repeats in (5, 6, 6):
+        adaptive.sent(KEY, {"id": 1234, "unit": 0, "state": True}, 3)
+        clock.advance(RF_ECHO_TIMEOUT + 1)
+        # The expired command is handled on the next packet
+        adaptive.received(KEY, {"id": 1234, "unit": 0, "state": True})
+        assert adaptive.repeats(KEY, 3) == repeats
+
+
+def test_adaptive_repeats_not_configured(clock: FakeClock) -> None:
+    """Test nothing is learned for devices without adaptive repeats."""
+    adaptive = RFAdaptiveRepeats()
+
+    _echo(adaptive, 7)
+    assert adaptive.learned == {}
+
+
+def test_adaptive_repeats_never_echoed(clock: FakeClock) -> None:
+    """Test devices which never echoed keep the configured repeats."""
+    adaptive = RFAdaptiveRepeats()
+    adaptive.repeats(KEY, 7)
+
+    adaptive.sent(KEY, {"id": 1234, "unit": 0, "state": True}, 7)
+    clock.advance(RF_ECHO_TIMEOUT + 1)
+    adaptive.received(KEY, {"id": 1234, "unit": 0, "state": True})
+    assert adaptive.learned == {}
+    assert adaptive.repeats(KEY, 7) == 7